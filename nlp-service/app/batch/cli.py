@@ -0,0 +1,80 @@
+"""
+Batch CLI Module
+Offline profile extraction and scoring of resume and job corpora
+
+Usage:
+    nlp-batch ingest resumes.jsonl stores/resumes
+    nlp-batch ingest jobs.jsonl stores/jobs
+    nlp-batch top-k stores/resumes stores/jobs matches.jsonl --k 10
+    nlp-batch all-pairs stores/resumes stores/jobs scores.npy
+"""
+
+import os
+
+# Each process scores its own block; keep BLAS from also spreading every
+# matrix product over all cores. Must be set before NumPy is imported.
+for _variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_variable, "1")
+
+import argparse
+import sys
+import time
+
+from .profile_store import ingest_jsonl
+from .scoring import score_all_pairs, score_top_k, RESUME_BLOCK, JOB_BLOCK
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nlp-batch", description="Offline resume and job scoring")
+    parser.add_argument("--workers", type=positive_int, default=None, help="processes to use (default: all cores)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="extract profiles from a JSONL corpus into a store")
+    ingest.add_argument("input", help="JSONL file with an optional 'id' and the document text per line")
+    ingest.add_argument("store", help="output store directory")
+
+    for name, help_text in (("top-k", "write the best jobs per resume as JSONL"),
+                            ("all-pairs", "write the full score matrix as a .npy file")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("resumes", help="resume store directory")
+        command.add_argument("jobs", help="job store directory")
+        command.add_argument("output", help="output file")
+        command.add_argument("--resume-block", type=positive_int, default=RESUME_BLOCK)
+        command.add_argument("--job-block", type=positive_int, default=JOB_BLOCK)
+        if name == "top-k":
+            command.add_argument("--k", type=positive_int, default=10)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+
+    if args.command == "ingest":
+        count = ingest_jsonl(args.input, args.store, workers=args.workers)
+        summary = f"ingested {count} documents"
+    elif args.command == "top-k":
+        count = score_top_k(args.resumes, args.jobs, args.output, top_k=args.k, workers=args.workers,
+                            resume_block=args.resume_block, job_block=args.job_block)
+        summary = f"scored top {args.k} jobs for {count} resumes"
+    else:
+        rows, columns = score_all_pairs(args.resumes, args.jobs, args.output, workers=args.workers,
+                                        resume_block=args.resume_block, job_block=args.job_block)
+        count = rows * columns
+        summary = f"scored {rows} x {columns} pairs"
+
+    elapsed = time.perf_counter() - started
+    print(f"{summary} in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f}/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Profile Store Module
+Compact on-disk columnar store of skill profiles backed by memory-mapped arrays
+
+Layout of a store directory:
+    meta.json       count, vocabularies, store and profile format versions
+    ids.txt         one document ID per line, in row order
+    technical.bits  uint8 (count, ceil(technical vocabulary / 8)), packed bits
+    soft.bits       uint8 (count, ceil(soft vocabulary / 8)), packed bits
+    years.i32       int32 (count,), years of experience (clamped), -1 when absent
+    level.i8        int8 (count,), ExperienceLevel value, -1 when absent
+    has_exp.u8      uint8 (count,), 1 when any experience keyword was found
+"""
+
+import json
+import logging
+import os
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..extractors.skill_extractor import extract_skills, PROFILE_FORMAT_VERSION
+from ..matchers.skill_matrix import TECH_VOCABULARY, SOFT_VOCABULARY, TECH_INDEX, SOFT_INDEX, skills_to_vector
+
+
+FORMAT_VERSION = 1
+
+# Years are stored as int32; absurd values in the text are clamped
+MAX_YEARS = np.iinfo(np.int32).max
+
+# Fields holding the document text, in order of preference
+TEXT_FIELDS = ("text", "resume_text", "job_description")
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileStore:
+    """Read access to a profile store directory through memory-mapped arrays"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+
+        if self.meta["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported format version {self.meta['format_version']}")
+        if self.meta.get("profile_format_version") != PROFILE_FORMAT_VERSION:
+            raise ValueError(f"{path}: built with a different profile format, re-ingest it")
+        if self.meta["technical_vocabulary"] != TECH_VOCABULARY or self.meta["soft_vocabulary"] != SOFT_VOCABULARY:
+            raise ValueError(f"{path}: built with a different skill taxonomy, re-ingest it")
+
+        self.count = self.meta["count"]
+        arrays = _array_specs(self.count)
+        self.technical, self.soft, self.years, self.level, self.has_experience = (
+            _open_array(path, name, dtype, shape, "r") for name, (dtype, shape) in arrays.items()
+        )
+
+    def ids(self) -> List[str]:
+        with open(os.path.join(self.path, "ids.txt")) as f:
+            return f.read().splitlines()
+
+    def unpack(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Unpack rows [start, stop) into float32 technical and soft skill matrices"""
+        technical = np.unpackbits(self.technical[start:stop], axis=1, count=len(TECH_VOCABULARY))
+        soft = np.unpackbits(self.soft[start:stop], axis=1, count=len(SOFT_VOCABULARY))
+        return technical.astype(np.float32), soft.astype(np.float32)
+
+
+def _array_specs(count: int) -> Dict[str, Tuple[type, tuple]]:
+    return {
+        "technical.bits": (np.uint8, (count, (len(TECH_VOCABULARY) + 7) // 8)),
+        "soft.bits": (np.uint8, (count, (len(SOFT_VOCABULARY) + 7) // 8)),
+        "years.i32": (np.int32, (count,)),
+        "level.i8": (np.int8, (count,)),
+        "has_exp.u8": (np.uint8, (count,)),
+    }
+
+
+def _open_array(path: str, name: str, dtype, shape: tuple, mode: str) -> np.ndarray:
+    # np.memmap cannot map empty files
+    if 0 in shape:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(os.path.join(path, name), dtype=dtype, mode=mode, shape=shape)
+
+
+def encode_profile(profile: Dict[str, List[str]]) -> Tuple[np.ndarray, np.ndarray, int, int, int]:
+    """
+    Encode an extract_skills profile as packed skill bits and experience values
+
+    Returns:
+        Tuple of packed technical bits, packed soft bits, years (-1 when
+        absent), level (-1 when absent) and whether any experience keyword
+        was found
+    """
+    years = profile['years_of_experience']
+    level = profile['experience_level']
+    return (
+        np.packbits(skills_to_vector(profile['technical_skills'], TECH_INDEX)),
+        np.packbits(skills_to_vector(profile['soft_skills'], SOFT_INDEX)),
+        -1 if years is None else min(years, MAX_YEARS),
+        -1 if level is None else level,
+        1 if profile['experience_keywords'] else 0,
+    )
+
+
+def _encode_line(numbered_line: Tuple[int, str]) -> Tuple[int, Optional[str], Optional[tuple], Optional[str]]:
+    """Encode one corpus line; errors are returned so one bad line does not abort the ingest"""
+    number, line = numbered_line
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        text = next((record[field] for field in TEXT_FIELDS if field in record), None)
+        if not isinstance(text, str):
+            raise ValueError(f"expected one of {', '.join(TEXT_FIELDS)}")
+        doc_id = str(record.get("id", number))
+        return number, doc_id, encode_profile(extract_skills(text)), None
+    except ValueError as e:
+        return number, None, None, str(e)
+
+
+def _iter_lines(path: str) -> Iterator[Tuple[int, str]]:
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                yield number, line
+
+
+def ingest_jsonl(input_path: str, output_path: str, workers: int = None, chunksize: int = 64) -> int:
+    """
+    Extract profiles from a JSONL corpus into a profile store
+
+    Each line is an object with an optional "id" and the text in "text",
+    "resume_text" or "job_description". Extraction runs on all cores and rows
+    are written straight into the memory-mapped arrays, so memory use does
+    not grow with the corpus. Lines that are not valid records or whose text
+    cannot be extracted (e.g. too large) are skipped and logged with their
+    line number.
+
+    Args:
+        input_path: JSONL corpus
+        output_path: Store directory to create
+        workers: Number of processes (defaults to all cores)
+        chunksize: Lines handed to a process at a time
+
+    Returns:
+        Number of profiles written
+    """
+    lines = sum(1 for _ in _iter_lines(input_path))
+    os.makedirs(output_path, exist_ok=True)
+    specs = _array_specs(lines)
+    arrays = [_open_array(output_path, name, dtype, shape, "w+") for name, (dtype, shape) in specs.items()]
+    technical, soft, years, level, has_experience = arrays
+
+    count = skipped = 0
+    with Pool(workers or os.cpu_count()) as pool, open(os.path.join(output_path, "ids.txt"), "w") as ids:
+        for number, doc_id, encoded, error in pool.imap(_encode_line, _iter_lines(input_path), chunksize):
+            if error is not None:
+                logger.warning("%s:%d: skipped: %s", input_path, number, error)
+                skipped += 1
+                continue
+            technical[count], soft[count], years[count], level[count], has_experience[count] = encoded
+            ids.write(doc_id.replace("\n", " ") + "\n")
+            count += 1
+
+    for array in arrays:
+        if isinstance(array, np.memmap):
+            array.flush()
+    del technical, soft, years, level, has_experience, arrays
+
+    # Drop the rows reserved for skipped lines
+    if skipped:
+        logger.warning("%s: skipped %d of %d lines", input_path, skipped, lines)
+        for name, (dtype, shape) in specs.items():
+            if 0 not in shape:
+                os.truncate(os.path.join(output_path, name), count * int(np.prod(shape[1:])) * np.dtype(dtype).itemsize)
+
+    with open(os.path.join(output_path, "meta.json"), "w") as f:
+        json.dump({
+            "format_version": FORMAT_VERSION,
+            "profile_format_version": PROFILE_FORMAT_VERSION,
+            "count": count,
+            "technical_vocabulary": TECH_VOCABULARY,
+            "soft_vocabulary": SOFT_VOCABULARY,
+        }, f)
+    return count
@@ -0,0 +1,187 @@
+"""
+Batch Scoring Module
+Blocked NumPy implementation of the calculate_match_score formula over
+profile stores
+"""
+
+import json
+import os
+from multiprocessing import Pool
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .profile_store import ProfileStore
+
+
+# Rows of resumes and columns of jobs scored at once; a block costs about
+# RESUME_BLOCK * JOB_BLOCK * 8 bytes per intermediate matrix
+RESUME_BLOCK = 256
+JOB_BLOCK = 4096
+
+
+def weighted_scores(matched: np.ndarray, required: np.ndarray, weight: float) -> np.ndarray:
+    """Vectorized calculate_weighted_score, including its floating point steps"""
+    base = matched / np.maximum(required, 1)
+    return np.where(required > 0, np.minimum(base * weight * (1 / weight), 1.0), 1.0)
+
+
+def experience_scores(
+    resume_years: np.ndarray, resume_level: np.ndarray,
+    job_years: np.ndarray, job_level: np.ndarray, job_has_experience: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized score_experience over resumes (rows) and jobs (columns)
+
+    Years and levels are -1 where absent.
+    """
+    r_years = resume_years.astype(np.float64)[:, None]
+    j_years = job_years.astype(np.float64)[None, :]
+    r_level = resume_level.astype(np.float64)[:, None]
+    j_level = job_level.astype(np.float64)[None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        by_years = np.where(r_years >= j_years, 1.0, np.maximum(0, r_years / j_years))
+        by_level = np.where(r_level >= j_level, 1.0, np.maximum(0, (r_level + 1) / (j_level + 1)))
+
+    scores = np.where(
+        (r_years >= 0) & (j_years >= 0), by_years,
+        np.where((r_level >= 0) & (j_level >= 0), by_level, 0.7)
+    )
+    return np.where(job_has_experience[None, :] > 0, scores, 1.0)
+
+
+def score_block(resumes: ProfileStore, jobs: ProfileStore, r_start: int, r_stop: int,
+                j_start: int, j_stop: int) -> np.ndarray:
+    """
+    Overall match scores (0-100, unrounded) for a block of resumes and jobs
+    """
+    r_tech, r_soft = resumes.unpack(r_start, r_stop)
+    j_tech, j_soft = jobs.unpack(j_start, j_stop)
+
+    # Counts stay exact in float32 for any realistic vocabulary size
+    tech = weighted_scores((r_tech @ j_tech.T).astype(np.float64), j_tech.sum(axis=1)[None, :], 0.7)
+    soft = weighted_scores((r_soft @ j_soft.T).astype(np.float64), j_soft.sum(axis=1)[None, :], 0.3)
+    experience = experience_scores(
+        resumes.years[r_start:r_stop], resumes.level[r_start:r_stop],
+        jobs.years[j_start:j_stop], jobs.level[j_start:j_stop], jobs.has_experience[j_start:j_stop]
+    )
+
+    skill_match = tech * 0.7 + soft * 0.3
+    return (skill_match * 0.7 + experience * 0.3) * 100
+
+
+_worker: Dict = {}
+
+
+def _init_worker(resumes_path: str, jobs_path: str, output_path: Optional[str], job_block: int):
+    _worker["resumes"] = ProfileStore(resumes_path)
+    _worker["jobs"] = ProfileStore(jobs_path)
+    _worker["job_block"] = job_block
+    if output_path:
+        _worker["output"] = np.lib.format.open_memmap(output_path, mode="r+")
+
+
+def _score_rows(rows: Tuple[int, int], top_k: Optional[int]):
+    resumes, jobs, job_block = _worker["resumes"], _worker["jobs"], _worker["job_block"]
+    r_start, r_stop = rows
+    best_scores = np.empty((r_stop - r_start, 0))
+    best_jobs = np.empty((r_stop - r_start, 0), dtype=np.int64)
+
+    for j_start in range(0, jobs.count, job_block):
+        j_stop = min(j_start + job_block, jobs.count)
+        scores = score_block(resumes, jobs, r_start, r_stop, j_start, j_stop)
+
+        if top_k is None:
+            _worker["output"][r_start:r_stop, j_start:j_stop] = scores
+            continue
+
+        # Keep a running top-k: merge the block with the best so far. Columns
+        # stay in job order, so ties go to the lowest job index whatever the
+        # block size
+        candidates = np.hstack([best_scores, scores])
+        candidate_jobs = np.hstack([best_jobs, np.broadcast_to(np.arange(j_start, j_stop), scores.shape)])
+        if candidates.shape[1] > top_k:
+            keep = _top_k_mask(candidates, top_k)
+            candidates = candidates[keep].reshape(len(candidates), top_k)
+            candidate_jobs = candidate_jobs[keep].reshape(len(candidates), top_k)
+        best_scores, best_jobs = candidates, candidate_jobs
+
+    if top_k is None:
+        _worker["output"].flush()
+        return r_start, None
+
+    order = np.lexsort((best_jobs, -best_scores), axis=1)
+    return r_start, (np.take_along_axis(best_scores, order, axis=1), np.take_along_axis(best_jobs, order, axis=1))
+
+
+def _top_k_mask(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Mask of the top_k highest scores per row, taking the leftmost of ties"""
+    kth = np.partition(scores, scores.shape[1] - top_k, axis=1)[:, -top_k][:, None]
+    above = scores > kth
+    tied = scores == kth
+    ties_needed = top_k - above.sum(axis=1, keepdims=True)
+    return above | (tied & (np.cumsum(tied, axis=1) <= ties_needed))
+
+
+def _row_blocks(count: int, block: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, count, block):
+        yield start, min(start + block, count)
+
+
+def score_all_pairs(resumes_path: str, jobs_path: str, output_path: str, workers: int = None,
+                    resume_block: int = RESUME_BLOCK, job_block: int = JOB_BLOCK) -> Tuple[int, int]:
+    """
+    Write the full resumes x jobs overall score matrix as a memory-mapped .npy
+
+    Scores are unrounded float64, so round(score, 1) gives exactly the
+    overall_score of calculate_match_score; float32 would not.
+
+    Returns:
+        Shape of the written matrix
+    """
+    resumes, jobs = ProfileStore(resumes_path), ProfileStore(jobs_path)
+    output = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64, shape=(resumes.count, jobs.count))
+    del output
+
+    with Pool(workers or os.cpu_count(), _init_worker, (resumes_path, jobs_path, output_path, job_block)) as pool:
+        for _ in pool.imap_unordered(_score_rows_all, _row_blocks(resumes.count, resume_block)):
+            pass
+    return resumes.count, jobs.count
+
+
+def _score_rows_all(rows: Tuple[int, int]):
+    return _score_rows(rows, None)
+
+
+def _score_rows_top_k(args: Tuple[Tuple[int, int], int]):
+    return _score_rows(*args)
+
+
+def score_top_k(resumes_path: str, jobs_path: str, output_path: str, top_k: int = 10, workers: int = None,
+                resume_block: int = RESUME_BLOCK, job_block: int = JOB_BLOCK) -> int:
+    """
+    Write the top-k jobs for every resume as JSONL, in resume order
+
+    Each line is {"resume_id": ..., "matches": [{"job_id": ..., "overall_score": ...}]}
+    with scores rounded like calculate_match_score.
+
+    Returns:
+        Number of resumes scored
+    """
+    resumes, jobs = ProfileStore(resumes_path), ProfileStore(jobs_path)
+    resume_ids, job_ids = resumes.ids(), jobs.ids()
+    tasks = ((rows, top_k) for rows in _row_blocks(resumes.count, resume_block))
+
+    with Pool(workers or os.cpu_count(), _init_worker, (resumes_path, jobs_path, None, job_block)) as pool, \
+            open(output_path, "w") as out:
+        for r_start, (scores, columns) in pool.imap(_score_rows_top_k, tasks):
+            for offset, (row_scores, row_jobs) in enumerate(zip(scores, columns)):
+                out.write(json.dumps({
+                    "resume_id": resume_ids[r_start + offset],
+                    "matches": [
+                        {"job_id": job_ids[job], "overall_score": round(float(score), 1)}
+                        for score, job in zip(row_scores, row_jobs)
+                    ]
+                }) + "\n")
+    return resumes.count
@@ -0,0 +1,127 @@
+"""
+Section Cache Module
+Reuse skill extraction results of unchanged resume sections and documents
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from ..extractors.section_splitter import split_sections
+from ..extractors.skill_extractor import extract_skills, merge_skill_profiles, check_input_size
+from .single_flight import extraction_flights, content_key
+from .shared_cache import shared_cache
+
+
+SECTION_CACHE_SIZE = int(os.getenv("NLP_SECTION_CACHE_SIZE", "10000"))
+
+
+class SectionCache:
+    """
+    Thread-safe LRU cache of skill profiles keyed by content hash
+
+    When the shared cache is enabled it backs this per-process cache, so a
+    section extracted by one worker is reused by the others.
+    """
+
+    def __init__(self, max_entries: int = SECTION_CACHE_SIZE, shared=shared_cache):
+        self.max_entries = max_entries
+        self.shared = shared
+        self.stats = {"hits": 0, "shared_hits": 0, "misses": 0}
+        self._profiles: "OrderedDict[str, Dict[str, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                self.stats["hits"] += 1
+                return profile
+
+        if self.shared is not None:
+            profile = self.shared.get(key)
+            if profile is not None:
+                self._store(key, profile, shared_hit=True)
+                return profile
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, profile: Dict[str, List[str]]):
+        self._store(key, profile)
+        if self.shared is not None:
+            self.shared.put(key, profile)
+
+    def _store(self, key: str, profile: Dict[str, List[str]], shared_hit: bool = False):
+        with self._lock:
+            if shared_hit:
+                # Shared-tier hits count as hits; shared_hits says how many
+                self.stats["hits"] += 1
+                self.stats["shared_hits"] += 1
+            self._profiles[key] = profile
+            self._profiles.move_to_end(key)
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            **stats,
+            "entries": len(self._profiles),
+            "max_entries": self.max_entries,
+            "shared": self.shared.snapshot() if self.shared is not None else None,
+        }
+
+
+section_cache = SectionCache()
+
+
+def extract_skills_by_section(text: str, cache: SectionCache = section_cache) -> Tuple[Dict[str, List[str]], List[Dict]]:
+    """
+    Extract skills section by section, rescanning only sections not seen before
+
+    Args:
+        text: Resume text
+        cache: Cache of per-section profiles
+
+    Returns:
+        Tuple of the merged skill profile and one report per section with its
+        name, content hash and whether the cached result was reused
+    """
+    check_input_size(text)
+
+    profiles = []
+    report = []
+    for name, section_text in split_sections(text) or [("header", text)]:
+        key = content_key(section_text)
+        profile, reused = extract_skills_cached(section_text, cache, key)
+        profiles.append(profile)
+        report.append({"name": name, "hash": key[:16], "reused": reused})
+
+    return merge_skill_profiles(profiles), report
+
+
+def extract_skills_cached(text: str, cache: SectionCache = section_cache, key: str = None) -> Tuple[Dict[str, List[str]], bool]:
+    """
+    Extract skills from text, reusing a cached result for identical text
+
+    Args:
+        text: Text to extract skills from
+        cache: Cache of profiles
+        key: Content key of the text, computed when omitted
+
+    Returns:
+        Tuple of the skill profile and whether it came from the cache
+    """
+    key = key or content_key(text)
+    profile = cache.get(key)
+    if profile is not None:
+        return profile, True
+
+    profile = extraction_flights.do(key, extract_skills, text)
+    cache.put(key, profile)
+    return profile, False
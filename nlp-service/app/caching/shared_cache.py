@@ -0,0 +1,178 @@
+"""
+Shared Cache Module
+Fixed-size skill profile cache in a memory-mapped file shared by all workers
+"""
+
+import fcntl
+import glob
+import hashlib
+import logging
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from ..extractors.skill_extractor import (
+    TECHNICAL_SKILLS, SOFT_SKILLS, EXPERIENCE_KEYWORDS, EDUCATION_KEYWORDS, PROFILE_FORMAT_VERSION
+)
+
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_ENABLED = os.getenv("NLP_SHARED_CACHE", "").lower() in ("1", "true", "yes")
+SHARED_CACHE_SLOTS = int(os.getenv("NLP_SHARED_CACHE_SLOTS", "16384"))
+SHARED_CACHE_DIR = os.getenv(
+    "NLP_SHARED_CACHE_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+)
+
+# Distinguishes the cache files of deployments sharing a host; only files
+# under this name are ever cleaned up
+SHARED_CACHE_NAME = os.path.basename(os.getenv("NLP_SHARED_CACHE_NAME", "nlp-service"))
+
+# Each slot holds a header (key digest, payload length, payload CRC32) and
+# a JSON payload; larger profiles are simply not shared
+SLOT_SIZE = 2048
+HEADER = struct.Struct("16sII")
+MAX_PAYLOAD = SLOT_SIZE - HEADER.size
+
+# Cached profiles are only valid for the taxonomy and extraction code that
+# produced them
+TAXONOMY_DIGEST = hashlib.sha256(repr((
+    PROFILE_FORMAT_VERSION,
+    sorted(TECHNICAL_SKILLS | SOFT_SKILLS | EXPERIENCE_KEYWORDS | EDUCATION_KEYWORDS)
+)).encode("utf-8")).hexdigest()[:12]
+
+CACHE_FILE_PREFIX = f"{SHARED_CACHE_NAME}-profiles-"
+
+
+class SharedProfileCache:
+    """
+    Direct-mapped cache of skill profiles in a shared memory-mapped file
+
+    Every process that opens the same file (or inherits the mapping across
+    fork) sees the same entries. Writers lock their slot against other
+    processes and take a per-process lock against other threads, since
+    lockf locks are held per process; readers do not lock and instead verify
+    the payload checksum, treating a torn read as a miss.
+    A new entry simply overwrites whatever occupied its slot.
+
+    Every process that opens the file holds a shared lock on the byte just
+    past its end for as long as it runs, so remove_stale_caches can tell
+    whether a file is still in use.
+    """
+
+    def __init__(self, path: str, slots: int = SHARED_CACHE_SLOTS):
+        self.path = path
+        self.slots = slots
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "too_large": 0}
+
+        size = slots * SLOT_SIZE
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.lockf(fd, fcntl.LOCK_SH, 1, size)
+            # The file may have been removed as stale between open and lock
+            try:
+                if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+        if os.fstat(fd).st_size != size:
+            os.ftruncate(fd, size)
+        self._fd = fd
+        self._map = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        self._write_lock = threading.Lock()
+
+    def _slot(self, digest: bytes) -> int:
+        return int.from_bytes(digest[:8], "little") % self.slots * SLOT_SIZE
+
+    def get(self, key: str) -> Optional[Dict[str, List[str]]]:
+        """Return the profile stored under a hex content key, if present"""
+        digest = bytes.fromhex(key)[:16]
+        offset = self._slot(digest)
+        stored, length, checksum = HEADER.unpack_from(self._map, offset)
+
+        if stored == digest and 0 < length <= MAX_PAYLOAD:
+            start = offset + HEADER.size
+            payload = self._map[start:start + length]
+            if zlib.crc32(payload) == checksum:
+                self.stats["hits"] += 1
+                return json.loads(payload)
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, profile: Dict[str, List[str]]):
+        """Store a profile under a hex content key"""
+        payload = json.dumps(profile, separators=(",", ":")).encode("utf-8")
+        if len(payload) > MAX_PAYLOAD:
+            self.stats["too_large"] += 1
+            return
+
+        digest = bytes.fromhex(key)[:16]
+        offset = self._slot(digest)
+        with self._write_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, SLOT_SIZE, offset)
+            try:
+                # Invalidate first so readers never pair the new header with a
+                # half-written payload
+                HEADER.pack_into(self._map, offset, b"\0" * 16, 0, 0)
+                start = offset + HEADER.size
+                self._map[start:start + len(payload)] = payload
+                HEADER.pack_into(self._map, offset, digest, len(payload), zlib.crc32(payload))
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, SLOT_SIZE, offset)
+            self.stats["writes"] += 1
+
+    def snapshot(self) -> Dict:
+        return {**self.stats, "path": self.path, "slots": self.slots, "bytes": self.slots * SLOT_SIZE}
+
+
+def open_shared_cache() -> Optional[SharedProfileCache]:
+    """
+    Open the shared cache file for this taxonomy, or None when disabled
+
+    Unused cache files of this deployment (SHARED_CACHE_NAME) from other
+    taxonomies, profile formats or sizes are removed; they would otherwise
+    hold on to RAM-backed space in /dev/shm until the next reboot.
+    """
+    if not SHARED_CACHE_ENABLED:
+        return None
+    path = os.path.join(SHARED_CACHE_DIR, f"{CACHE_FILE_PREFIX}{TAXONOMY_DIGEST}-{SHARED_CACHE_SLOTS}.cache")
+    remove_stale_caches(path)
+    return SharedProfileCache(path)
+
+
+def remove_stale_caches(current_path: str):
+    """
+    Delete this deployment's cache files other than current_path that no
+    running process has open
+
+    A file is in use while any process holds the shared lock taken by
+    SharedProfileCache, e.g. the other half of a rolling deploy.
+    """
+    for stale in glob.glob(os.path.join(SHARED_CACHE_DIR, f"{CACHE_FILE_PREFIX}*.cache")):
+        if os.path.abspath(stale) == os.path.abspath(current_path):
+            continue
+        try:
+            fd = os.open(stale, os.O_RDWR)
+        except OSError:
+            continue
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, os.fstat(fd).st_size)
+            os.unlink(stale)
+            logger.info("Removed stale shared cache %s", stale)
+        except (BlockingIOError, PermissionError):
+            pass  # Still open in another process
+        except OSError as e:
+            logger.warning("Could not remove stale shared cache %s: %s", stale, e)
+        finally:
+            os.close(fd)
+
+
+shared_cache = open_shared_cache()
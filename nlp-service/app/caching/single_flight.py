@@ -0,0 +1,103 @@
+"""
+Single Flight Module
+Coalesce concurrent identical computations into one execution
+"""
+
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict
+
+from ..middleware.profiler import run_in_worker
+
+
+def content_key(*parts: str) -> str:
+    """Hash the given strings into a key for deduplicating work"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time
+
+    Callers arriving while a computation for their key is in flight wait for
+    the same result instead of starting their own. Results are shared, so
+    callers must not mutate them. Errors are delivered to every waiting
+    caller and the key is forgotten, so the next call retries.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    async def run(self, key: str, func: Callable, *args, **kwargs):
+        """
+        Await the result of func(*args, **kwargs) computed in the threadpool
+
+        The computation runs in its own task, so a cancelled caller neither
+        cancels it nor affects the other callers waiting on it.
+        """
+        self.stats["calls"] += 1
+        task = self._tasks.get(key)
+        if task is None:
+            self.stats["executions"] += 1
+            task = asyncio.ensure_future(run_in_worker(func, *args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._task_done(key, t))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _task_done(self, key: str, task: asyncio.Future):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+
+    def do(self, key: str, func: Callable, *args, **kwargs):
+        """
+        Thread-safe blocking variant of run for code already in a worker thread
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = Future()
+                self.stats["executions"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._futures[key]
+        return future.result()
+
+    def snapshot(self) -> Dict:
+        return {**self.stats, "in_flight": len(self._tasks) + len(self._futures)}
+
+
+request_flights = SingleFlight("requests")
+extraction_flights = SingleFlight("extractions")
+
+
+def single_flight_stats() -> Dict:
+    """Return coalescing counters; "coalesced" counts computations saved"""
+    return {flight.name: flight.snapshot() for flight in (request_flights, extraction_flights)}
@@ -0,0 +1,106 @@
+"""
+Experience Parser Module
+Turn extracted experience and education keywords into comparable values
+"""
+
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional
+
+
+class ExperienceLevel(IntEnum):
+    """Seniority implied by experience level keywords"""
+    INTERN = 0
+    ENTRY_LEVEL = 1
+    JUNIOR = 2
+    MID_LEVEL = 3
+    SENIOR = 4
+    LEAD = 5
+    PRINCIPAL = 6
+    ARCHITECT = 7
+    DIRECTOR = 8
+
+
+class DegreeTier(IntEnum):
+    """Highest qualification implied by education keywords"""
+    CERTIFICATION = 0
+    BACHELOR = 1
+    MASTER = 2
+    DOCTORATE = 3
+
+
+# Seniority of experience level keywords; a keyword containing several of
+# these takes the highest
+LEVEL_HIERARCHY = {
+    'intern': ExperienceLevel.INTERN, 'internship': ExperienceLevel.INTERN,
+    'entry level': ExperienceLevel.ENTRY_LEVEL, 'entry-level': ExperienceLevel.ENTRY_LEVEL,
+    'junior': ExperienceLevel.JUNIOR, 'mid-level': ExperienceLevel.MID_LEVEL,
+    'senior': ExperienceLevel.SENIOR, 'lead': ExperienceLevel.LEAD,
+    'principal': ExperienceLevel.PRINCIPAL, 'staff': ExperienceLevel.PRINCIPAL,
+    'architect': ExperienceLevel.ARCHITECT, 'director': ExperienceLevel.DIRECTOR
+}
+
+# Only unambiguous taxonomy terms imply a degree: "be", "ba", "bs", "ma" and
+# "ms" are mostly ordinary words or other abbreviations ("to be part of a
+# team"). The "scrum master" role is excluded when "master" is extracted.
+DEGREE_TIERS = {
+    'certification': DegreeTier.CERTIFICATION, 'certified': DegreeTier.CERTIFICATION,
+    'diploma': DegreeTier.CERTIFICATION, 'bootcamp': DegreeTier.CERTIFICATION,
+    'bachelor': DegreeTier.BACHELOR, 'bachelors': DegreeTier.BACHELOR, "bachelor's": DegreeTier.BACHELOR,
+    'bsc': DegreeTier.BACHELOR, 'btech': DegreeTier.BACHELOR,
+    'master': DegreeTier.MASTER, 'masters': DegreeTier.MASTER, "master's": DegreeTier.MASTER,
+    'msc': DegreeTier.MASTER, 'mba': DegreeTier.MASTER, 'mtech': DegreeTier.MASTER,
+    'phd': DegreeTier.DOCTORATE, 'ph.d': DegreeTier.DOCTORATE,
+    'doctorate': DegreeTier.DOCTORATE, 'doctoral': DegreeTier.DOCTORATE
+}
+
+
+def keyword_level(keyword: str) -> Optional[ExperienceLevel]:
+    """Return the highest level whose name occurs in a keyword, if any"""
+    keyword_lower = keyword.lower()
+    levels = [level for name, level in LEVEL_HIERARCHY.items() if name in keyword_lower]
+    return max(levels) if levels else None
+
+
+class ExperienceParser:
+    """
+    Lookup tables from taxonomy keywords to experience levels and degree tiers
+
+    The substring rules are applied once per taxonomy keyword when the parser
+    is built, so parsing an extracted profile is a dictionary lookup per
+    keyword.
+    """
+
+    def __init__(self, experience_keywords: Iterable[str], education_keywords: Iterable[str]):
+        self.levels: Dict[str, ExperienceLevel] = {}
+        for keyword in experience_keywords:
+            level = keyword_level(keyword)
+            if level is not None:
+                self.levels[keyword.lower()] = level
+
+        self.tiers: Dict[str, DegreeTier] = {
+            keyword.lower(): DEGREE_TIERS[keyword.lower()]
+            for keyword in education_keywords if keyword.lower() in DEGREE_TIERS
+        }
+
+    def parse(self, experience_keywords: List[str], education: List[str], years: Optional[int]) -> Dict[str, Optional[int]]:
+        """
+        Structured experience values of an extracted profile
+
+        Args:
+            experience_keywords: Experience keywords found in the text
+            education: Education keywords found in the text
+            years: Largest number of years mentioned, if any
+
+        Returns:
+            Dictionary with years_of_experience, experience_level (an
+            ExperienceLevel value) and education_level (a DegreeTier value),
+            each None when the text gives no indication. Values are plain
+            ints so profiles stay JSON serializable.
+        """
+        levels = [self.levels[k.lower()] for k in experience_keywords if k.lower() in self.levels]
+        tiers = [self.tiers[k.lower()] for k in education if k.lower() in self.tiers]
+        return {
+            "years_of_experience": years,
+            "experience_level": int(max(levels)) if levels else None,
+            "education_level": int(max(tiers)) if tiers else None
+        }
@@ -0,0 +1,77 @@
+"""
+Section Splitter Module
+Split resume text into sections at recognized headings
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me'],
+    'experience': ['experience', 'work experience', 'professional experience',
+                   'employment history', 'work history'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'key skills'],
+    'education': ['education', 'academic background', 'qualifications'],
+    'projects': ['projects', 'personal projects'],
+    'certifications': ['certifications', 'certificates'],
+}
+
+# Name of the text before the first heading (contact details, headline)
+HEADER_SECTION = 'header'
+
+_HEADING_NAMES: Dict[str, str] = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+_ALTERNATION = '|'.join(
+    re.escape(heading) for heading in sorted(_HEADING_NAMES, key=len, reverse=True)
+)
+
+# A heading is either alone on its line, or written in capitals or
+# title-cased and followed by a colon at the start of a line or sentence; the
+# last two also survive clean_text, which joins everything onto one line.
+# Headings inside a sentence ("Analytical Skills: ...") are not split on, so
+# that no skill or keyword is cut in two
+_HEADING_START = r'(?:^[ \t]*|(?<=[.!?])[ \t]+)'
+HEADING_PATTERNS = [
+    re.compile(r'^[ \t]*(' + _ALTERNATION + r')[ \t]*:?[ \t]*$', re.IGNORECASE | re.MULTILINE),
+    re.compile(_HEADING_START + r'(' + _ALTERNATION.upper() + r')\b', re.MULTILINE),
+    re.compile(_HEADING_START + r'(' + '|'.join(
+        re.escape(heading.title()) for heading in sorted(_HEADING_NAMES, key=len, reverse=True)
+    ) + r')\s*:', re.MULTILINE),
+]
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Split text into (section name, section text) pairs in document order
+
+    Each section starts at its heading and runs to the next one. Sections
+    only break at line or sentence starts, so the merged skill profiles of
+    the sections equal the profile of the whole text.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        List of (name, text) pairs; text before the first heading is named
+        HEADER_SECTION, and blank sections are dropped
+    """
+    headings = []
+    for pattern in HEADING_PATTERNS:
+        for match in pattern.finditer(text):
+            headings.append((match.start(1), match.end(), _HEADING_NAMES[match.group(1).lower()]))
+    headings.sort()
+
+    sections = []
+    previous_start, previous_name, heading_end = 0, HEADER_SECTION, 0
+    for start, end, name in headings:
+        # The same heading can be found by several patterns
+        if start < heading_end:
+            continue
+        if start > previous_start:
+            sections.append((previous_name, text[previous_start:start]))
+        previous_start, previous_name, heading_end = start, name, end
+    sections.append((previous_name, text[previous_start:]))
+
+    return [(name, body) for name, body in sections if body.strip()]
@@ -3,8 +3,30 @@ Skill Extractor Module
 Extract technical skills, soft skills, and other relevant information from text using NLP
 """
 
+import os
 import re
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .experience_parser import ExperienceParser
+
+
+# Inputs longer than this are rejected before any scanning
+MAX_INPUT_CHARS = int(os.getenv("NLP_MAX_INPUT_CHARS", "500000"))
+
+# Inputs longer than this are scanned in overlapping windows
+CHUNKED_SCAN_THRESHOLD = int(os.getenv("NLP_CHUNKED_SCAN_THRESHOLD", "20000"))
+SCAN_CHUNK_SIZE = int(os.getenv("NLP_SCAN_CHUNK_SIZE", "8192"))
+
+# Bump whenever a change to extraction can change the profile produced for
+# the same text (patterns, keys, parsing tables), so persisted caches of
+# profiles are invalidated
+PROFILE_FORMAT_VERSION = 3
+
+YEARS_PATTERN = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)?')
+
+
+class InputTooLargeError(ValueError):
+    """Raised when text exceeds the configured input ceiling"""
 
 
 # Comprehensive skill databases
@@ -114,6 +136,14 @@ EDUCATION_KEYWORDS = {
     'degree', 'diploma', 'coursework', 'bootcamp'
 }
 
+# Words that make a following taxonomy term mean something else, e.g. the
+# role "scrum master" is not a master's degree
+EXCLUDED_PREFIXES = {
+    'master': ('scrum',)
+}
+
+experience_parser = ExperienceParser(EXPERIENCE_KEYWORDS, EDUCATION_KEYWORDS)
+
 
 def extract_skills(text: str) -> Dict[str, List[str]]:
     """
@@ -123,8 +153,17 @@ def extract_skills(text: str) -> Dict[str, List[str]]:
         text: Resume or job description text
         
     Returns:
-        Dictionary containing extracted skills and information
+        Dictionary containing extracted skills and information, including
+        the parsed years_of_experience, experience_level and education_level
+        
+    Raises:
+        InputTooLargeError: If the text is longer than MAX_INPUT_CHARS
     """
+    check_input_size(text)
+    
+    if len(text) > CHUNKED_SCAN_THRESHOLD:
+        return extract_skills_chunked(text)
+    
     text_lower = text.lower()
     
     # Extract technical skills
@@ -140,8 +179,8 @@ def extract_skills(text: str) -> Dict[str, List[str]]:
     education = find_skills_in_text(text_lower, EDUCATION_KEYWORDS)
     
     # Extract years of experience
-    years_pattern = r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)?'
-    years_matches = re.findall(years_pattern, text_lower)
+    years_matches = YEARS_PATTERN.findall(text_lower)
+    max_years = None
     if years_matches:
         max_years = max(int(y) for y in years_matches)
         experience_keywords.append(f"{max_years}+ years")
@@ -150,10 +189,134 @@ def extract_skills(text: str) -> Dict[str, List[str]]:
         "technical_skills": sorted(list(set(technical_skills))),
         "soft_skills": sorted(list(set(soft_skills))),
         "experience_keywords": sorted(list(set(experience_keywords))),
-        "education": sorted(list(set(education)))
+        "education": sorted(list(set(education))),
+        **experience_parser.parse(experience_keywords, education, max_years)
     }
 
 
+def check_input_size(text: str):
+    """Raise InputTooLargeError if text is longer than MAX_INPUT_CHARS"""
+    if len(text) > MAX_INPUT_CHARS:
+        raise InputTooLargeError(
+            f"Text is {len(text)} characters; the limit is {MAX_INPUT_CHARS}"
+        )
+
+
+def extract_skills_chunked(text: str, chunk_size: int = SCAN_CHUNK_SIZE) -> Dict[str, List[str]]:
+    """
+    Extract skills by scanning fixed-size overlapping windows of the text
+    
+    Only one lowercased window is alive at a time, and skills already found
+    are not searched for again, so memory stays constant in input size.
+    Results are identical to the whole-text scan as long as the whitespace
+    between a number and "years" is shorter than the window overlap.
+    
+    Args:
+        text: Resume or job description text
+        chunk_size: Number of characters each window advances by
+        
+    Returns:
+        Dictionary containing extracted skills and information
+    """
+    skill_sets = {
+        "technical_skills": TECHNICAL_SKILLS,
+        "soft_skills": SOFT_SKILLS,
+        "experience_keywords": EXPERIENCE_KEYWORDS,
+        "education": EDUCATION_KEYWORDS,
+    }
+    remaining = {key: set(skill_set) for key, skill_set in skill_sets.items()}
+    found = {key: [] for key in skill_sets}
+    max_years = None
+    
+    for window, core_start, core_end in iter_scan_windows(text, chunk_size, SCAN_OVERLAP, SCAN_LOOKBEHIND):
+        for key, skills in remaining.items():
+            hits = []
+            for skill in skills:
+                position = _search_skill(window, skill, core_start, core_end)
+                if position is not None:
+                    hits.append(skill)
+            for skill in hits:
+                skills.discard(skill)
+                found[key].append(skill.title() if len(skill) > 3 else skill.upper())
+        
+        for match in YEARS_PATTERN.finditer(window, core_start):
+            if match.start() >= core_end:
+                break
+            years = int(match.group(1))
+            if max_years is None or years > max_years:
+                max_years = years
+    
+    if max_years is not None:
+        found["experience_keywords"].append(f"{max_years}+ years")
+    
+    profile = {key: sorted(set(values)) for key, values in found.items()}
+    profile.update(experience_parser.parse(profile["experience_keywords"], profile["education"], max_years))
+    return profile
+
+
+def merge_skill_profiles(profiles: List[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """
+    Combine skill profiles of parts of one document into a single profile
+    
+    Args:
+        profiles: Profiles as returned by extract_skills
+        
+    Returns:
+        Profile in the extract_skills format, keeping only the largest
+        "N+ years" entry
+    """
+    merged = {key: set() for key in ("technical_skills", "soft_skills", "experience_keywords", "education")}
+    max_years = None
+    
+    for profile in profiles:
+        for key, values in merged.items():
+            for value in profile[key]:
+                match = _YEARS_ENTRY.fullmatch(value) if key == "experience_keywords" else None
+                if match:
+                    years = int(match.group(1))
+                    max_years = years if max_years is None else max(max_years, years)
+                else:
+                    values.add(value)
+    
+    if max_years is not None:
+        merged["experience_keywords"].add(f"{max_years}+ years")
+    
+    result = {key: sorted(values) for key, values in merged.items()}
+    result.update(experience_parser.parse(result["experience_keywords"], result["education"], max_years))
+    return result
+
+
+_YEARS_ENTRY = re.compile(r'(\d+)\+ years')
+
+
+def iter_scan_windows(text: str, chunk_size: int, overlap: int, lookbehind: int = 1) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield lowercased overlapping windows of the text
+    
+    Each window covers one chunk plus ``lookbehind`` characters of context
+    before it and ``overlap`` characters after it, so word boundaries and
+    excluded prefixes at the chunk edges are evaluated against the real
+    neighbouring text.
+    
+    Args:
+        text: Text to split
+        chunk_size: Number of characters each window advances by
+        overlap: Characters of lookahead past the end of each chunk
+        lookbehind: Characters of context before each chunk
+        
+    Returns:
+        Iterator of (window, core_start, core_end); matches starting in
+        [core_start, core_end) belong to this window. Bounds are positions
+        in the lowercased window, since lowercasing can change the length
+        of the text (e.g. 'İ')
+    """
+    for start in range(0, max(len(text), 1), chunk_size):
+        context = text[max(0, start - lookbehind):start].lower()
+        core = text[start:start + chunk_size].lower()
+        lookahead = text[start + chunk_size:start + chunk_size + overlap].lower()
+        yield context + core + lookahead, len(context), len(context) + len(core)
+
+
 def find_skills_in_text(text: str, skill_set: Set[str]) -> List[str]:
     """
     Find skills from a skill set that appear in the text
@@ -168,14 +331,60 @@ def find_skills_in_text(text: str, skill_set: Set[str]) -> List[str]:
     found_skills = []
     
     for skill in skill_set:
-        # Create a pattern that matches the skill as a whole word
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text):
+        if _search_skill(text, skill) is not None:
             found_skills.append(skill.title() if len(skill) > 3 else skill.upper())
     
     return found_skills
 
 
+def _search_skill(text: str, skill: str, start: int = 0, end: Optional[int] = None) -> Optional[int]:
+    """
+    Find the first whole-word occurrence of a skill starting in [start, end)
+    
+    Candidates are located with a plain substring search and only then checked
+    against the word-boundary pattern, which is much cheaper than running the
+    regex over the whole text for every skill.
+    """
+    pattern = _SKILL_PATTERNS.get(skill)
+    if pattern is None:
+        pattern = _SKILL_PATTERNS[skill] = _compile_skill_pattern(skill)
+    
+    position = text.find(skill, start)
+    while position != -1 and (end is None or position < end):
+        if pattern.match(text, position):
+            return position
+        position = text.find(skill, position + 1)
+    return None
+
+
+_SKILL_PATTERNS: Dict[str, "re.Pattern"] = {}
+
+
+def _compile_skill_pattern(skill: str) -> "re.Pattern":
+    """Whole-word pattern for a skill that is not preceded by one of its excluded prefixes"""
+    excluded = ''.join(r'(?<!\b' + re.escape(word) + r'[\s-])' for word in EXCLUDED_PREFIXES.get(skill, ()))
+    return re.compile(excluded + r'\b' + re.escape(skill) + r'\b')
+
+
+def precompile_skill_patterns():
+    """Compile the patterns of every taxonomy entry up front"""
+    for skill in TECHNICAL_SKILLS | SOFT_SKILLS | EXPERIENCE_KEYWORDS | EDUCATION_KEYWORDS:
+        if skill not in _SKILL_PATTERNS:
+            _SKILL_PATTERNS[skill] = _compile_skill_pattern(skill)
+
+# Windows must look far enough past their chunk to see any skill, plus the
+# character after it for the closing word boundary
+SCAN_OVERLAP = max(
+    len(skill) for skill in TECHNICAL_SKILLS | SOFT_SKILLS | EXPERIENCE_KEYWORDS | EDUCATION_KEYWORDS
+) + 64
+
+# Windows must also see far enough before their chunk for the opening word
+# boundary of any excluded prefix
+SCAN_LOOKBEHIND = max(
+    (len(word) for words in EXCLUDED_PREFIXES.values() for word in words), default=0
+) + 2
+
+
 def normalize_skill(skill: str) -> str:
     """
     Normalize skill name for consistent matching
@@ -6,7 +6,10 @@ Calculate match scores between resumes and job descriptions
 import re
 from typing import Dict, List, Set, Tuple
 from collections import Counter
-from ..extractors.skill_extractor import extract_skills, normalize_skill
+from ..extractors.skill_extractor import normalize_skill
+from ..extractors.experience_parser import LEVEL_HIERARCHY
+from .semantic_matcher import semantic_matching_enabled, find_semantic_skills
+from ..caching.section_cache import extract_skills_by_section, extract_skills_cached
 
 
 def calculate_match_score(resume_text: str, job_description: str) -> Dict:
@@ -20,10 +23,32 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
     Returns:
         Dictionary containing match scores and analysis
     """
-    # Extract skills from both documents
-    resume_skills = extract_skills(resume_text)
-    job_skills = extract_skills(job_description)
+    # Extract skills from both documents. Resume sections unchanged since an
+    # earlier analysis are reused, and so are job descriptions seen before
+    resume_skills, resume_sections = extract_skills_by_section(resume_text)
+    job_skills, _ = extract_skills_cached(job_description)
     
+    resume_semantic = None
+    if semantic_matching_enabled():
+        resume_semantic = find_semantic_skills([resume_text])[0]
+    
+    result = match_skill_profiles(resume_skills, job_skills, resume_semantic)
+    result["resume_sections"] = resume_sections
+    return result
+
+
+def match_skill_profiles(resume_skills: Dict, job_skills: Dict, resume_semantic: Dict = None) -> Dict:
+    """
+    Calculate match score between already extracted skill profiles
+    
+    Args:
+        resume_skills: Skills extracted from the resume
+        job_skills: Skills extracted from the job description
+        resume_semantic: Optional semantic skill hits for the resume
+        
+    Returns:
+        Dictionary containing match scores and analysis
+    """
     # Normalize skills for comparison
     resume_tech = set(normalize_skill(s) for s in resume_skills['technical_skills'])
     job_tech = set(normalize_skill(s) for s in job_skills['technical_skills'])
@@ -31,6 +56,11 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
     resume_soft = set(normalize_skill(s) for s in resume_skills['soft_skills'])
     job_soft = set(normalize_skill(s) for s in job_skills['soft_skills'])
     
+    # Credit job skills the resume expresses in other words
+    if resume_semantic:
+        resume_tech |= job_tech.intersection(resume_semantic['technical_skills'])
+        resume_soft |= job_soft.intersection(resume_semantic['soft_skills'])
+    
     # Calculate technical skill match
     matched_tech = resume_tech.intersection(job_tech)
     missing_tech = job_tech - resume_tech
@@ -44,10 +74,7 @@ def calculate_match_score(resume_text: str, job_description: str) -> Dict:
     soft_score = calculate_weighted_score(matched_soft, job_soft, weight=0.3)
     
     # Experience match score
-    experience_score = calculate_experience_match(
-        resume_skills['experience_keywords'],
-        job_skills['experience_keywords']
-    )
+    experience_score = score_experience(resume_skills, job_skills)
     
     # Calculate overall score with weights
     # Technical: 50%, Soft Skills: 20%, Experience: 30%
@@ -99,9 +126,49 @@ def calculate_weighted_score(matched: Set[str], required: Set[str], weight: floa
     return min(base_score * weight * (1 / weight), 1.0)  # Normalize to max 1.0
 
 
+def score_experience(resume_skills: Dict, job_skills: Dict) -> float:
+    """
+    Calculate experience level match from the values parsed at extraction
+    
+    Gives the same score as calculate_experience_match on the profiles'
+    experience keywords without parsing them again.
+    
+    Args:
+        resume_skills: Skills extracted from the resume
+        job_skills: Skills extracted from the job description
+        
+    Returns:
+        Match score between 0 and 1
+    """
+    if not job_skills['experience_keywords']:
+        return 1.0  # No specific experience required
+    
+    resume_years = resume_skills['years_of_experience']
+    job_years = job_skills['years_of_experience']
+    
+    if resume_years is not None and job_years is not None:
+        if resume_years >= job_years:
+            return 1.0
+        return max(0, resume_years / job_years)
+    
+    resume_level = resume_skills['experience_level']
+    job_level = job_skills['experience_level']
+    
+    if resume_level is not None and job_level is not None:
+        if resume_level >= job_level:
+            return 1.0
+        return max(0, (resume_level + 1) / (job_level + 1))
+    
+    # Default to partial match if can't determine
+    return 0.7
+
+
 def calculate_experience_match(resume_exp: List[str], job_exp: List[str]) -> float:
     """
-    Calculate experience level match
+    Calculate experience level match from keyword lists
+    
+    Parses the keywords on every call; use score_experience for extracted
+    profiles.
     
     Args:
         resume_exp: Experience keywords from resume
@@ -125,14 +192,8 @@ def calculate_experience_match(resume_exp: List[str], job_exp: List[str]) -> flo
             return max(0, resume_years / job_years)
     
     # Check for level keywords
-    level_hierarchy = {
-        'intern': 0, 'internship': 0, 'entry level': 1, 'entry-level': 1,
-        'junior': 2, 'mid-level': 3, 'senior': 4, 'lead': 5,
-        'principal': 6, 'staff': 6, 'architect': 7, 'director': 8
-    }
-    
-    resume_level = get_highest_level(resume_exp, level_hierarchy)
-    job_level = get_highest_level(job_exp, level_hierarchy)
+    resume_level = get_highest_level(resume_exp, LEVEL_HIERARCHY)
+    job_level = get_highest_level(job_exp, LEVEL_HIERARCHY)
     
     if resume_level is not None and job_level is not None:
         if resume_level >= job_level:
@@ -0,0 +1,230 @@
+"""
+Pair Stream Module
+Score streamed NDJSON resume-job pairs in pipelined micro-batches
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import AsyncIterator, Dict, List
+
+from starlette.responses import StreamingResponse
+
+from ..extractors.skill_extractor import extract_skills
+from ..store.document_store import DocumentStore, job_store, resume_store
+from .matching_engine import match_skill_profiles
+from .semantic_matcher import semantic_matching_enabled, find_semantic_skills
+from ..middleware.profiler import run_in_worker
+
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = int(os.getenv("NLP_STREAM_BATCH_SIZE", "64"))
+
+# Parsed batches waiting to be scored; bounds memory together with the
+# batch size and the line limit
+STREAM_PIPELINE_DEPTH = int(os.getenv("NLP_STREAM_PIPELINE_DEPTH", "2"))
+STREAM_MAX_LINE_BYTES = int(os.getenv("NLP_STREAM_MAX_LINE_BYTES", "1000000"))
+
+STREAM_STATS = {"streams": 0, "pairs": 0, "batches": 0, "extractions": 0, "extractions_reused": 0, "seconds": 0.0}
+
+
+class LineTooLongError(ValueError):
+    """Raised when an NDJSON line exceeds STREAM_MAX_LINE_BYTES"""
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response that can be sent while the request body is still read
+
+    StreamingResponse normally watches receive() for a disconnect, which would
+    swallow request body messages; here reading the body notices the
+    disconnect instead.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split a byte stream into non-empty lines
+
+    Raises:
+        LineTooLongError: If a line grows past STREAM_MAX_LINE_BYTES
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+        if len(buffer) > STREAM_MAX_LINE_BYTES:
+            raise LineTooLongError(f"NDJSON line exceeds {STREAM_MAX_LINE_BYTES} bytes")
+    if buffer.strip():
+        yield buffer
+
+
+def parse_pair(line: bytes) -> Dict:
+    """
+    Parse and validate one pair record
+
+    Returns:
+        The record, or a dictionary with an "error" key if it is invalid
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return {"error": f"Invalid JSON: {e}"}
+
+    if not isinstance(record, dict):
+        return {"error": "Each line must be a JSON object"}
+    if ("resume_text" in record) == ("resume_id" in record):
+        return {"error": "Provide exactly one of resume_text or resume_id"}
+    if ("job_description" in record) == ("job_id" in record):
+        return {"error": "Provide exactly one of job_description or job_id"}
+    for key in ("resume_text", "resume_id", "job_description", "job_id"):
+        if key in record and not isinstance(record[key], str):
+            return {"error": f"{key} must be a string"}
+    return record
+
+
+def score_batch(
+    records: List[Dict],
+    resumes: DocumentStore = resume_store,
+    jobs: DocumentStore = job_store
+) -> List[Dict]:
+    """
+    Score a micro-batch of pairs, extracting each distinct text only once
+
+    Args:
+        records: Parsed pair records, in stream order
+        resumes: Registry resume IDs are resolved in
+        jobs: Registry job IDs are resolved in
+
+    Returns:
+        One result or error dictionary per record, in the same order
+    """
+    profiles: Dict[str, Dict] = {}
+    extractions = 0
+    reused = 0
+
+    def profile_for(text: str) -> Dict:
+        nonlocal extractions, reused
+        profile = profiles.get(text)
+        if profile is None:
+            profile = profiles[text] = extract_skills(text)
+            extractions += 1
+        else:
+            reused += 1
+        return profile
+
+    semantic: Dict[str, Dict] = {}
+    if semantic_matching_enabled():
+        resume_texts = list({r["resume_text"] for r in records if "error" not in r and "resume_text" in r})
+        semantic = dict(zip(resume_texts, find_semantic_skills(resume_texts)))
+
+    results = []
+    for record in records:
+        if "error" in record:
+            results.append({"error": record["error"]})
+            continue
+        try:
+            if "resume_text" in record:
+                resume_profile = profile_for(record["resume_text"])
+                resume_semantic = semantic.get(record["resume_text"])
+            else:
+                resume_profile = resumes.get(record["resume_id"])
+                if resume_profile is None:
+                    raise KeyError(f"Unknown resume ID: {record['resume_id']}")
+                resume_semantic = resume_profile.get("semantic_skills")
+
+            if "job_description" in record:
+                job_profile = profile_for(record["job_description"])
+            else:
+                job_profile = jobs.get(record["job_id"])
+                if job_profile is None:
+                    raise KeyError(f"Unknown job ID: {record['job_id']}")
+
+            result = match_skill_profiles(resume_profile, job_profile, resume_semantic)
+            for key in ("resume_id", "job_id"):
+                if key in record:
+                    result[key] = record[key]
+            results.append(result)
+        except KeyError as e:
+            results.append({"error": str(e.args[0])})
+        except Exception as e:
+            results.append({"error": f"Error calculating match: {str(e)}"})
+
+    STREAM_STATS["extractions"] += extractions
+    STREAM_STATS["extractions_reused"] += reused
+    return results
+
+
+async def stream_match_results(chunks: AsyncIterator[bytes], batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """
+    Score an NDJSON stream of pairs and yield NDJSON results in input order
+
+    Reading and parsing the next batches overlaps with scoring the current
+    one in the threadpool. Every result line carries the zero-based "index"
+    of its input line.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_PIPELINE_DEPTH)
+
+    async def produce():
+        batch = []
+        try:
+            async for line in iter_ndjson_lines(chunks):
+                batch.append(parse_pair(line))
+                if len(batch) >= batch_size:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    started = time.perf_counter()
+    producer = asyncio.create_task(produce())
+    index = 0
+    STREAM_STATS["streams"] += 1
+    try:
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                break
+            if isinstance(batch, Exception):
+                yield (json.dumps({"index": index, "error": str(batch)}) + "\n").encode("utf-8")
+                break
+
+            results = await run_in_worker(score_batch, batch)
+            lines = []
+            for result in results:
+                lines.append(json.dumps({"index": index, **result}))
+                index += 1
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            STREAM_STATS["pairs"] += len(batch)
+            STREAM_STATS["batches"] += 1
+    finally:
+        producer.cancel()
+        elapsed = time.perf_counter() - started
+        STREAM_STATS["seconds"] += elapsed
+        logger.info("Scored %d pairs in %.2fs (%.1f pairs/s)", index, elapsed, index / elapsed if elapsed else 0.0)
+
+
+def stream_stats() -> Dict:
+    """Return pair stream throughput counters"""
+    seconds = STREAM_STATS["seconds"]
+    return {
+        **STREAM_STATS,
+        "seconds": round(seconds, 3),
+        "pairs_per_second": round(STREAM_STATS["pairs"] / seconds, 1) if seconds else None,
+    }
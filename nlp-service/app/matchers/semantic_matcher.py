@@ -0,0 +1,225 @@
+"""
+Semantic Matcher Module
+Optional embedding-based skill matching with a local spaCy vectors model
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .skill_matrix import TECH_VOCABULARY, SOFT_VOCABULARY
+
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_MATCHING_ENABLED = os.getenv("NLP_SEMANTIC_MATCHING", "").lower() in ("1", "true", "yes")
+
+# Must be an installed package with word vectors (sm models have none);
+# nothing is downloaded at runtime
+SPACY_MODEL = os.getenv("NLP_SPACY_MODEL", "en_core_web_md")
+SEMANTIC_THRESHOLD = float(os.getenv("NLP_SEMANTIC_THRESHOLD", "0.8"))
+SEMANTIC_BATCH_SIZE = int(os.getenv("NLP_SEMANTIC_BATCH_SIZE", "32"))
+VECTOR_CACHE_DIR = os.getenv(
+    "NLP_VECTOR_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".cache")
+)
+
+# Longest phrase (in content tokens) compared against the taxonomy
+MAX_PHRASE_TOKENS = 3
+
+# Phrases are scored in blocks of this many rows to bound memory on long texts
+PHRASE_BLOCK_SIZE = 4096
+
+# Only the tokenizer and the vectors table are needed
+EXCLUDED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+_load_lock = threading.Lock()
+_model: Optional[Dict] = None
+_load_failed = False
+
+SEMANTIC_STATS = {"documents": 0, "batches": 0, "seconds": 0.0}
+_stats_lock = threading.Lock()
+
+
+def semantic_matching_enabled() -> bool:
+    """True when semantic matching is switched on and the model is available"""
+    return SEMANTIC_MATCHING_ENABLED and load_model() is not None
+
+
+def load_model() -> Optional[Dict]:
+    """
+    Load the spaCy model and taxonomy vectors once per process
+
+    Returns:
+        Dictionary with the pipeline, skill names and categories and the
+        normalized taxonomy matrix, or None if spaCy or the model is missing
+    """
+    global _model, _load_failed
+
+    if _model is not None or _load_failed:
+        return _model
+
+    with _load_lock:
+        if _model is not None or _load_failed:
+            return _model
+        try:
+            import spacy
+            nlp = spacy.load(SPACY_MODEL, exclude=EXCLUDED_PIPES)
+        except (ImportError, OSError) as e:
+            logger.warning("Semantic matching disabled: %s", e)
+            _load_failed = True
+            return None
+
+        if nlp.vocab.vectors.shape[0] == 0:
+            logger.warning("Semantic matching disabled: %s has no word vectors", SPACY_MODEL)
+            _load_failed = True
+            return None
+
+        skills = [(s, "technical") for s in TECH_VOCABULARY] + [(s, "soft") for s in SOFT_VOCABULARY]
+        names, categories, vectors = load_taxonomy_vectors(nlp, skills)
+        _model = {"nlp": nlp, "skills": names, "categories": categories, "vectors": vectors}
+        return _model
+
+
+def load_taxonomy_vectors(nlp, skills: List[tuple]) -> tuple:
+    """
+    Load taxonomy vectors from the disk cache, computing them on a miss
+
+    Args:
+        nlp: Loaded spaCy pipeline
+        skills: (skill, category) pairs to embed
+
+    Returns:
+        Tuple of skill names, categories and an L2-normalized vector matrix;
+        skills without any known word vector are left out
+    """
+    meta = nlp.meta
+    key = hashlib.sha256(
+        repr((meta.get("name"), meta.get("version"), skills)).encode("utf-8")
+    ).hexdigest()[:16]
+    model_name = os.path.basename(SPACY_MODEL.rstrip("/\\"))
+    cache_path = os.path.join(VECTOR_CACHE_DIR, f"taxonomy-{model_name}-{key}.npz")
+
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as cached:
+                return [str(s) for s in cached["skills"]], [str(c) for c in cached["categories"]], cached["vectors"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable taxonomy vector cache %s: %s", cache_path, e)
+
+    names, categories, rows = [], [], []
+    for doc, (skill, category) in zip(nlp.pipe(s for s, _ in skills), skills):
+        if not doc.has_vector or not doc.vector_norm:
+            continue
+        names.append(skill)
+        categories.append(category)
+        rows.append(doc.vector / doc.vector_norm)
+
+    vectors = np.array(rows, dtype=np.float32)
+    # The cache only saves start-up time; a read-only location is not an error
+    try:
+        os.makedirs(VECTOR_CACHE_DIR, exist_ok=True)
+        np.savez(cache_path, skills=np.array(names), categories=np.array(categories), vectors=vectors)
+    except OSError as e:
+        logger.warning("Taxonomy vectors not cached: %s", e)
+    return names, categories, vectors
+
+
+def find_semantic_skills(texts: List[str], batch_size: int = SEMANTIC_BATCH_SIZE) -> List[Dict[str, List[str]]]:
+    """
+    Find taxonomy skills whose meaning appears in each text
+
+    Every phrase of up to MAX_PHRASE_TOKENS consecutive content words is
+    embedded as the mean of its word vectors and compared to all taxonomy
+    vectors at once; a skill is found when any phrase reaches
+    SEMANTIC_THRESHOLD cosine similarity.
+
+    Args:
+        texts: Documents to analyze
+        batch_size: Number of documents tokenized per nlp.pipe batch
+
+    Returns:
+        One dictionary per text with normalized "technical_skills" and
+        "soft_skills" lists
+    """
+    model = load_model()
+    if model is None:
+        return [{"technical_skills": [], "soft_skills": []} for _ in texts]
+
+    nlp = model["nlp"]
+    table = nlp.vocab.vectors
+    started = time.perf_counter()
+    results = []
+
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        tokens = [t for t in doc if t.is_alpha and not t.is_stop]
+        rows = np.array(table.find(keys=[t.orth for t in tokens])) if tokens else np.empty(0, dtype=int)
+        # Capitalized or sentence-initial words ("Kubernetes") are often only
+        # in the table in lowercase
+        missing = np.flatnonzero(rows < 0)
+        if len(missing):
+            rows[missing] = table.find(keys=[tokens[i].lower for i in missing])
+        token_vectors = table.data[rows[rows >= 0]] if len(rows) else np.empty((0, table.shape[1]))
+        scores = best_skill_scores(np.asarray(token_vectors, dtype=np.float32), model["vectors"])
+
+        found = {"technical_skills": [], "soft_skills": []}
+        for column in np.flatnonzero(scores >= SEMANTIC_THRESHOLD):
+            category = "technical_skills" if model["categories"][column] == "technical" else "soft_skills"
+            found[category].append(model["skills"][column])
+        results.append(found)
+
+    with _stats_lock:
+        SEMANTIC_STATS["documents"] += len(texts)
+        SEMANTIC_STATS["batches"] += (len(texts) + batch_size - 1) // batch_size
+        SEMANTIC_STATS["seconds"] += time.perf_counter() - started
+    return results
+
+
+def best_skill_scores(token_vectors: np.ndarray, taxonomy: np.ndarray) -> np.ndarray:
+    """
+    Highest cosine similarity of any phrase to each taxonomy skill
+
+    Args:
+        token_vectors: Word vectors of a document's content tokens, in order
+        taxonomy: L2-normalized taxonomy matrix (skills x dims)
+
+    Returns:
+        Vector with one best score per taxonomy skill
+    """
+    best = np.full(taxonomy.shape[0], -1.0, dtype=np.float32)
+    if len(token_vectors) == 0:
+        return best
+
+    # Sums over every window of n tokens via a cumulative sum; the mean has
+    # the same direction, so normalizing the sum is enough
+    cumulative = np.vstack([np.zeros((1, token_vectors.shape[1]), dtype=np.float32),
+                            np.cumsum(token_vectors, axis=0)])
+    for n in range(1, min(MAX_PHRASE_TOKENS, len(token_vectors)) + 1):
+        phrases = cumulative[n:] - cumulative[:-n]
+        norms = np.linalg.norm(phrases, axis=1, keepdims=True)
+        phrases = phrases / np.maximum(norms, 1e-8)
+        for start in range(0, len(phrases), PHRASE_BLOCK_SIZE):
+            block = phrases[start:start + PHRASE_BLOCK_SIZE] @ taxonomy.T
+            np.maximum(best, block.max(axis=0), out=best)
+    return best
+
+
+def semantic_stats() -> Dict:
+    """Return semantic matching throughput counters"""
+    with _stats_lock:
+        stats = dict(SEMANTIC_STATS)
+    seconds = stats["seconds"]
+    return {
+        "enabled": SEMANTIC_MATCHING_ENABLED,
+        "model": SPACY_MODEL,
+        "loaded": _model is not None,
+        "documents": stats["documents"],
+        "batches": stats["batches"],
+        "seconds": round(seconds, 3),
+        "documents_per_second": round(stats["documents"] / seconds, 1) if seconds else None,
+    }
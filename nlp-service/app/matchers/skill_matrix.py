@@ -0,0 +1,71 @@
+"""
+Skill Matrix Module
+Map extracted skills onto fixed skill-ID vocabularies for vectorized scoring
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from ..extractors.skill_extractor import TECHNICAL_SKILLS, SOFT_SKILLS, normalize_skill
+
+
+# Column order of the technical and soft skill matrices
+TECH_VOCABULARY = sorted({normalize_skill(s) for s in TECHNICAL_SKILLS})
+SOFT_VOCABULARY = sorted({normalize_skill(s) for s in SOFT_SKILLS})
+
+TECH_INDEX = {skill: i for i, skill in enumerate(TECH_VOCABULARY)}
+SOFT_INDEX = {skill: i for i, skill in enumerate(SOFT_VOCABULARY)}
+
+
+def skills_to_vector(skills: Iterable[str], index: Dict[str, int]) -> np.ndarray:
+    """
+    Encode extracted skills as a boolean vector over a vocabulary
+
+    Args:
+        skills: Skills as returned by extract_skills
+        index: Vocabulary index (TECH_INDEX or SOFT_INDEX)
+
+    Returns:
+        Boolean vector with one column per vocabulary entry
+    """
+    vector = np.zeros(len(index), dtype=bool)
+    for skill in skills:
+        column = index.get(normalize_skill(skill))
+        if column is not None:
+            vector[column] = True
+    return vector
+
+
+def profiles_to_matrices(profiles: List[Dict[str, List[str]]]) -> Dict[str, np.ndarray]:
+    """
+    Encode a list of extracted profiles as technical and soft skill matrices
+
+    Args:
+        profiles: Skill profiles as returned by extract_skills
+
+    Returns:
+        Dictionary with boolean "technical" and "soft" matrices, one row per profile
+    """
+    technical = np.zeros((len(profiles), len(TECH_VOCABULARY)), dtype=bool)
+    soft = np.zeros((len(profiles), len(SOFT_VOCABULARY)), dtype=bool)
+
+    for row, profile in enumerate(profiles):
+        technical[row] = skills_to_vector(profile['technical_skills'], TECH_INDEX)
+        soft[row] = skills_to_vector(profile['soft_skills'], SOFT_INDEX)
+
+    return {"technical": technical, "soft": soft}
+
+
+def coverage_scores(matched: np.ndarray, required: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of calculate_weighted_score
+
+    Args:
+        matched: Number of matched skills per row
+        required: Number of required skills per row
+
+    Returns:
+        Fraction of required skills matched, 1.0 where nothing is required
+    """
+    return np.where(required > 0, matched / np.maximum(required, 1), 1.0)
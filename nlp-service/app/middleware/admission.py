@@ -0,0 +1,179 @@
+"""
+Admission Control Module
+Per-endpoint concurrency limits with fast load shedding
+"""
+
+import asyncio
+import math
+import os
+import time
+from typing import Dict, Optional
+
+from starlette.responses import JSONResponse
+
+
+ADMISSION_CONTROL_ENABLED = os.getenv("NLP_ADMISSION_CONTROL", "true").lower() in ("1", "true", "yes")
+
+# Endpoints not listed here (/health, /, /stats, ...) are never queued or shed
+ENDPOINT_CLASSES = {
+    "/extract-skills": "cheap",
+    "/match": "cheap",
+    "/jobs": "cheap",
+    "/resumes": "cheap",
+    "/extract-text": "expensive",
+    "/recommend": "expensive",
+    "/gaps": "expensive",
+    # A stream holds its slot until the last result is sent, which can take
+    # hours, so streams must not occupy the slots of short requests
+    "/match/stream": "stream",
+}
+
+# Weight of the latest queue wait in the moving average used to shed early
+QUEUE_WAIT_SMOOTHING = 0.2
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limit with a bounded, time-limited wait queue
+
+    A request is rejected at once when the queue is full or when recent queue
+    waits already exceed ``max_queue_wait``; otherwise it waits at most that
+    long for a slot.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, max_queue_wait: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.active = 0
+        self.queued = 0
+        self.average_queue_wait = 0.0
+        self.stats = {
+            "admitted": 0, "rejected_queue_full": 0, "rejected_queue_latency": 0,
+            "rejected_timeout": 0, "queue_seconds_total": 0.0, "queue_seconds_max": 0.0
+        }
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self) -> Optional[float]:
+        """
+        Wait for a slot
+
+        Returns:
+            None when admitted, otherwise the suggested Retry-After in seconds
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        if self.active < self.max_concurrent and self.queued == 0:
+            await self._semaphore.acquire()
+            self._admit(0.0)
+            return None
+
+        if self.queued >= self.max_queue:
+            self.stats["rejected_queue_full"] += 1
+            return self.retry_after()
+        if self.average_queue_wait > self.max_queue_wait:
+            self.stats["rejected_queue_latency"] += 1
+            # Decay so a quiet period lets requests probe the queue again
+            self.average_queue_wait *= 1 - QUEUE_WAIT_SMOOTHING
+            return self.retry_after()
+
+        started = time.perf_counter()
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.max_queue_wait)
+        except asyncio.TimeoutError:
+            self._record_wait(self.max_queue_wait)
+            self.stats["rejected_timeout"] += 1
+            return self.retry_after()
+        finally:
+            self.queued -= 1
+
+        self._admit(time.perf_counter() - started)
+        return None
+
+    def release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.average_queue_wait))
+
+    def _admit(self, waited: float):
+        self.active += 1
+        self.stats["admitted"] += 1
+        self._record_wait(waited)
+
+    def _record_wait(self, waited: float):
+        self.average_queue_wait += QUEUE_WAIT_SMOOTHING * (waited - self.average_queue_wait)
+        self.stats["queue_seconds_total"] += waited
+        self.stats["queue_seconds_max"] = max(self.stats["queue_seconds_max"], waited)
+
+    def snapshot(self) -> Dict:
+        return {
+            **self.stats,
+            "queue_seconds_total": round(self.stats["queue_seconds_total"], 3),
+            "queue_seconds_max": round(self.stats["queue_seconds_max"], 3),
+            "average_queue_wait": round(self.average_queue_wait, 3),
+            "active": self.active,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
+
+
+def _limiter_from_env(name: str, max_concurrent: int, max_queue: int, max_queue_wait: float) -> AdmissionLimiter:
+    prefix = f"NLP_ADMISSION_{name.upper()}"
+    return AdmissionLimiter(
+        name,
+        int(os.getenv(f"{prefix}_CONCURRENCY", str(max_concurrent))),
+        int(os.getenv(f"{prefix}_QUEUE", str(max_queue))),
+        float(os.getenv(f"{prefix}_MAX_WAIT", str(max_queue_wait))),
+    )
+
+
+LIMITERS = {
+    "cheap": _limiter_from_env("cheap", 8, 64, 2.0),
+    "expensive": _limiter_from_env("expensive", 2, 8, 5.0),
+    "stream": _limiter_from_env("stream", 2, 4, 5.0),
+}
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware that admits, queues or sheds requests per endpoint class"""
+
+    def __init__(self, app, limiters: Dict[str, AdmissionLimiter] = LIMITERS):
+        self.app = app
+        self.limiters = limiters
+
+    async def __call__(self, scope, receive, send):
+        limiter = None
+        if scope["type"] == "http":
+            limiter = self.limiters.get(ENDPOINT_CLASSES.get(scope["path"].rstrip("/") or "/"))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = await limiter.acquire()
+        if retry_after is not None:
+            response = JSONResponse(
+                {"detail": "Service is overloaded, please retry later"},
+                status_code=503,
+                headers={"Retry-After": str(retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+def admission_stats() -> Dict:
+    """Return admission counters per endpoint class"""
+    return {
+        "enabled": ADMISSION_CONTROL_ENABLED,
+        "classes": {name: limiter.snapshot() for name, limiter in LIMITERS.items()},
+    }
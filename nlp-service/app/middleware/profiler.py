@@ -0,0 +1,278 @@
+"""
+Request Profiler Module
+Opt-in per-request profiling with cProfile and a stack sampler
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+
+# Profiling is only wired into the app when this is set, so a disabled
+# service pays nothing per request
+PROFILING_ENABLED = os.getenv("NLP_PROFILING_ENABLED", "").lower() in ("1", "true", "yes")
+
+# Fraction of requests profiled without an explicit header (0.0 - 1.0)
+PROFILE_SAMPLE_RATE = float(os.getenv("NLP_PROFILE_SAMPLE_RATE", "0"))
+
+PROFILE_DIR = os.getenv("NLP_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "nlp-profiles"))
+PROFILE_MAX_FILES = int(os.getenv("NLP_PROFILE_MAX_FILES", "50"))
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("NLP_PROFILE_SAMPLE_INTERVAL", "0.001"))
+
+PROFILE_REQUEST_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Functions whose cumulative time is reported in every profile summary
+ATTRIBUTED_FUNCTIONS = {
+    "find_skills_in_text": "skill_extractor.py",
+    "extract_skills": "skill_extractor.py",
+    "extract_skills_chunked": "skill_extractor.py",
+    "clean_text": "text_extractor.py",
+    "extract_text_from_pdf": "text_extractor.py",
+    "extract_text_from_docx": "text_extractor.py",
+    "calculate_match_score": "matching_engine.py",
+    "generate_recommendations": "ai_recommender.py",
+}
+
+# cProfile installs one profiler per thread, so profiled requests never overlap
+_profile_lock = threading.Lock()
+
+
+class StackSampler:
+    """Periodically samples the call stacks of a set of threads into collapsed-stack counts"""
+
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_ids = {thread_id}
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in list(self.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(names))] += 1
+
+
+class RequestProfile:
+    """Profilers and sampler collecting data for one profiled request"""
+
+    def __init__(self, thread_id: int):
+        self.profilers = [cProfile.Profile()]
+        self.sampler = StackSampler(thread_id)
+
+
+_active_profile: ContextVar[Optional[RequestProfile]] = ContextVar("active_profile", default=None)
+
+
+def should_profile(headers: Dict[str, str]) -> bool:
+    """
+    Decide whether a request is profiled
+
+    Args:
+        headers: Request headers (lowercase keys)
+
+    Returns:
+        True when the profile header is set or the request is sampled
+    """
+    if headers.get(PROFILE_REQUEST_HEADER, "").lower() in ("1", "true", "yes"):
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def attribute_time(stats: pstats.Stats) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize cumulative time spent in the attributed functions
+
+    Args:
+        stats: Collected profile statistics
+
+    Returns:
+        Mapping of function name to call count and cumulative seconds
+    """
+    summary = {}
+    for (filename, _, func_name), (_, ncalls, _, cumtime, _) in stats.stats.items():
+        module = ATTRIBUTED_FUNCTIONS.get(func_name)
+        if module is None or not filename.endswith(module):
+            continue
+        entry = summary.setdefault(func_name, {"calls": 0, "cumulative_seconds": 0.0})
+        entry["calls"] += ncalls
+        entry["cumulative_seconds"] = round(entry["cumulative_seconds"] + cumtime, 6)
+    return summary
+
+
+def new_profile_id() -> str:
+    return f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+
+
+def save_profile(profile: RequestProfile, path: str, elapsed: float, profile_id: Optional[str] = None) -> str:
+    """
+    Write pstats, collapsed stacks and a JSON summary for one request
+
+    Args:
+        profile: Finished request profile
+        path: Request path, recorded in the summary
+        elapsed: Wall-clock request duration in seconds
+        profile_id: ID to store the profile under; generated when omitted
+
+    Returns:
+        Profile ID
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    profile_id = profile_id or new_profile_id()
+    base = os.path.join(PROFILE_DIR, profile_id)
+
+    sampler = profile.sampler
+    stats = pstats.Stats(*profile.profilers)
+    stats.dump_stats(f"{base}.pstats")
+
+    with open(f"{base}.collapsed", "w") as f:
+        for stack, count in sampler.stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    with open(f"{base}.json", "w") as f:
+        json.dump({
+            "profile_id": profile_id,
+            "path": path,
+            "elapsed_seconds": round(elapsed, 6),
+            "samples": sum(sampler.stacks.values()),
+            "attributed": attribute_time(stats),
+        }, f, indent=2)
+
+    prune_profiles()
+    return profile_id
+
+
+def prune_profiles():
+    """Delete the oldest profiles so at most PROFILE_MAX_FILES are kept"""
+    groups: Dict[str, List[str]] = {}
+    for name in os.listdir(PROFILE_DIR):
+        groups.setdefault(name.split(".")[0], []).append(os.path.join(PROFILE_DIR, name))
+
+    oldest_first = sorted(groups, key=lambda pid: min(os.path.getmtime(p) for p in groups[pid]))
+    for profile_id in oldest_first[:max(0, len(groups) - PROFILE_MAX_FILES)]:
+        for file_path in groups[profile_id]:
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+
+
+async def profiling_middleware(request, call_next):
+    """
+    Profile the request when asked to and report the profile ID in a header
+
+    cProfile follows the event loop thread and any work the request hands to
+    run_in_worker, so concurrent requests running on the loop at the same
+    time are included in the profile. Recording lasts until the response
+    body has been sent, so streamed responses are profiled in full; the
+    profile is saved afterwards under the ID already sent in the header. A
+    request that asks for a profile while another one is being recorded is
+    served unprofiled.
+    """
+    if not should_profile(request.headers) or not _profile_lock.acquire(blocking=False):
+        return await call_next(request)
+
+    profile = RequestProfile(threading.get_ident())
+    loop_profiler = profile.profilers[0]
+    token = _active_profile.set(profile)
+    started = time.perf_counter()
+    profile.sampler.start()
+    loop_profiler.enable()
+
+    async def finish():
+        loop_profiler.disable()
+        profile.sampler.stop()
+        _profile_lock.release()
+        # Writing and pruning profile files is blocking I/O; keep it off the loop
+        await run_in_threadpool(save_profile, profile, request.url.path, time.perf_counter() - started, profile_id)
+
+    try:
+        response = await call_next(request)
+    except BaseException:
+        loop_profiler.disable()
+        profile.sampler.stop()
+        _profile_lock.release()
+        raise
+    finally:
+        _active_profile.reset(token)
+
+    profile_id = new_profile_id()
+    body = response.body_iterator
+
+    async def profiled_body():
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            await finish()
+
+    response.body_iterator = profiled_body()
+    response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
+
+
+def load_profile_summary(profile_id: str) -> Optional[Dict]:
+    """Load the JSON summary of a stored profile, if it still exists"""
+    if os.path.basename(profile_id) != profile_id:
+        return None
+    try:
+        with open(os.path.join(PROFILE_DIR, f"{profile_id}.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _call_profiled(func: Callable, *args, **kwargs):
+    """Run a function in the current worker thread under the request's profile"""
+    profile = _active_profile.get()
+    if profile is None:
+        return func(*args, **kwargs)
+
+    thread_id = threading.get_ident()
+    profiler = cProfile.Profile()
+    profile.sampler.thread_ids.add(thread_id)
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profile.sampler.thread_ids.discard(thread_id)
+        profile.profilers.append(profiler)
+
+
+async def _run_in_worker_profiled(func: Callable, *args, **kwargs):
+    return await run_in_threadpool(_call_profiled, func, *args, **kwargs)
+
+
+# Runs CPU-bound work in the threadpool; only pays for the profile lookup
+# when profiling is enabled
+run_in_worker = _run_in_worker_profiled if PROFILING_ENABLED else run_in_threadpool
@@ -0,0 +1,214 @@
+"""
+Gap Analyzer Module
+Rank a candidate's missing skills by their value across a corpus of jobs
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..extractors.skill_extractor import extract_skills
+from ..matchers.skill_matrix import (
+    TECH_VOCABULARY, SOFT_VOCABULARY, TECH_INDEX, SOFT_INDEX,
+    skills_to_vector, profiles_to_matrices, coverage_scores
+)
+from ..store.document_store import DocumentStore, job_store
+from ..batch.scoring import experience_scores as vectorized_experience_scores
+from .ai_recommender import SKILL_PRIORITIES
+
+
+# Score weights from calculate_match_score: one extra technical skill raises
+# the overall score by TECH_WEIGHT / required technical skills, and likewise
+# for soft skills
+TECH_WEIGHT = 0.7 * 0.7
+SOFT_WEIGHT = 0.7 * 0.3
+EXPERIENCE_WEIGHT = 0.3
+
+# Per-job experience columns of a corpus, as used by experience_scores
+EXPERIENCE_COLUMNS = ("years", "level", "has_experience")
+
+
+class UnknownJobError(KeyError):
+    """Raised when requested job IDs are not registered"""
+
+
+_corpus_lock = threading.Lock()
+_corpus_cache: Dict[int, Dict] = {}
+
+
+def analyze_skill_gaps(
+    resume_text: str,
+    job_ids: Optional[List[str]] = None,
+    job_descriptions: Optional[List[str]] = None,
+    top_k: int = 10,
+    store: DocumentStore = job_store
+) -> Dict:
+    """
+    Rank missing skills by how often they are required and how much they
+    would raise the candidate's match scores across a job corpus
+
+    Args:
+        resume_text: Text content of the resume
+        job_ids: IDs of registered jobs to analyze against
+        job_descriptions: Job description texts to analyze against
+        top_k: Number of recommendations to return
+        store: Registry the job IDs are resolved in
+
+    Returns:
+        Dictionary containing corpus statistics and ranked recommendations
+
+    Raises:
+        UnknownJobError: If a job ID is not registered
+    """
+    corpus = build_corpus(job_ids, job_descriptions, store)
+    resume_skills = extract_skills(resume_text)
+
+    technical = corpus["technical"]
+    soft = corpus["soft"]
+    job_count = technical.shape[0]
+
+    if job_count == 0:
+        return {"jobs_analyzed": 0, "average_match_score": 0.0, "recommendations": []}
+
+    resume_tech = skills_to_vector(resume_skills['technical_skills'], TECH_INDEX)
+    resume_soft = skills_to_vector(resume_skills['soft_skills'], SOFT_INDEX)
+
+    required_tech = technical.sum(axis=1)
+    required_soft = soft.sum(axis=1)
+    tech_scores = coverage_scores((technical & resume_tech).sum(axis=1), required_tech)
+    soft_scores = coverage_scores((soft & resume_soft).sum(axis=1), required_soft)
+
+    resume_experience = experience_arrays([resume_skills])
+    experience_scores = vectorized_experience_scores(
+        resume_experience["years"], resume_experience["level"],
+        corpus["years"], corpus["level"], corpus["has_experience"]
+    )[0]
+
+    skill_scores = tech_scores * 0.7 + soft_scores * 0.3
+    overall_scores = skill_scores * 0.7 + experience_scores * EXPERIENCE_WEIGHT
+
+    # Score gained in each job by adding each skill; zero where the job does
+    # not ask for it or the resume already has it
+    tech_gain = (technical & ~resume_tech) * (TECH_WEIGHT / np.maximum(required_tech, 1))[:, None]
+    soft_gain = (soft & ~resume_soft) * (SOFT_WEIGHT / np.maximum(required_soft, 1))[:, None]
+
+    recommendations = (
+        rank_gaps(tech_gain, TECH_VOCABULARY, "technical") +
+        rank_gaps(soft_gain, SOFT_VOCABULARY, "soft")
+    )
+    recommendations.sort(
+        key=lambda r: (r["average_score_gain"], r["job_frequency"], r["priority"]),
+        reverse=True
+    )
+
+    return {
+        "jobs_analyzed": job_count,
+        "average_match_score": round(float(overall_scores.mean()) * 100, 1),
+        "recommendations": recommendations[:top_k]
+    }
+
+
+def rank_gaps(gain: np.ndarray, vocabulary: List[str], category: str) -> List[Dict]:
+    """
+    Summarize a jobs-by-skills gain matrix into per-skill recommendations
+
+    Args:
+        gain: Score gain per job (rows) and skill (columns), between 0 and 1
+        vocabulary: Skill name for each column
+        category: "technical" or "soft"
+
+    Returns:
+        One recommendation per skill that any job is missing
+    """
+    job_count = gain.shape[0]
+    frequency = (gain > 0).sum(axis=0)
+    average_gain = gain.sum(axis=0) / job_count
+    max_gain = gain.max(axis=0)
+
+    recommendations = []
+    for column in np.flatnonzero(frequency):
+        skill = vocabulary[column]
+        recommendations.append({
+            "skill": skill.title(),
+            "category": category,
+            "job_frequency": int(frequency[column]),
+            "coverage": round(float(frequency[column]) / job_count * 100, 1),
+            "average_score_gain": round(float(average_gain[column]) * 100, 2),
+            "max_score_gain": round(float(max_gain[column]) * 100, 1),
+            "priority": SKILL_PRIORITIES.get(skill, 5)
+        })
+    return recommendations
+
+
+def build_corpus(
+    job_ids: Optional[List[str]],
+    job_descriptions: Optional[List[str]],
+    store: DocumentStore
+) -> Dict:
+    """
+    Assemble skill matrices and experience columns for the requested jobs
+
+    With neither IDs nor descriptions the whole registry is used. Matrices for
+    registered jobs are cached until the registry changes.
+    """
+    parts = []
+
+    if job_ids or not job_descriptions:
+        registered = registered_corpus(store)
+        if job_ids:
+            missing = [job_id for job_id in job_ids if job_id not in registered["rows"]]
+            if missing:
+                raise UnknownJobError(f"Unknown job IDs: {', '.join(missing[:10])}")
+            rows = [registered["rows"][job_id] for job_id in job_ids]
+            parts.append({
+                "technical": registered["technical"][rows],
+                "soft": registered["soft"][rows],
+                **{column: registered[column][rows] for column in EXPERIENCE_COLUMNS}
+            })
+        else:
+            parts.append(registered)
+
+    if job_descriptions:
+        profiles = [extract_skills(text) for text in job_descriptions]
+        matrices = profiles_to_matrices(profiles)
+        matrices.update(experience_arrays(profiles))
+        parts.append(matrices)
+
+    return {
+        "technical": np.concatenate([p["technical"] for p in parts]),
+        "soft": np.concatenate([p["soft"] for p in parts]),
+        **{column: np.concatenate([p[column] for p in parts]) for column in EXPERIENCE_COLUMNS}
+    }
+
+
+def experience_arrays(profiles: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Collect the parsed experience values of profiles into arrays
+
+    Returns:
+        Dictionary with "years" and "level" (-1 where absent) and
+        "has_experience" (1 when any experience keyword was found)
+    """
+    return {
+        "years": np.array([-1 if p['years_of_experience'] is None else p['years_of_experience'] for p in profiles], dtype=np.int64),
+        "level": np.array([-1 if p['experience_level'] is None else p['experience_level'] for p in profiles], dtype=np.int64),
+        "has_experience": np.array([1 if p['experience_keywords'] else 0 for p in profiles], dtype=np.uint8),
+    }
+
+
+def registered_corpus(store: DocumentStore) -> Dict:
+    """Return cached skill matrices and experience columns for every job in the registry"""
+    with _corpus_lock:
+        cached = _corpus_cache.get(id(store))
+        if cached is not None and cached["version"] == store.version:
+            return cached
+
+        version, items = store.snapshot()
+        profiles = [profile for _, profile in items]
+        corpus = profiles_to_matrices(profiles)
+        corpus.update(experience_arrays(profiles))
+        corpus["rows"] = {job_id: row for row, (job_id, _) in enumerate(items)}
+        corpus["version"] = version
+        _corpus_cache[id(store)] = corpus
+        return corpus
@@ -0,0 +1 @@
+# Store Package
@@ -0,0 +1,88 @@
+"""
+Document Store Module
+In-memory registry of extracted skill profiles for jobs and resumes
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..extractors.skill_extractor import extract_skills
+from ..matchers.semantic_matcher import semantic_matching_enabled, find_semantic_skills
+
+
+MAX_STORED_DOCUMENTS = int(os.getenv("NLP_MAX_STORED_DOCUMENTS", "50000"))
+
+
+def content_id(text: str) -> str:
+    """Derive a stable document ID from the text content"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class DocumentStore:
+    """
+    Bounded registry of skill profiles keyed by document ID
+
+    Only the extracted profile is kept, not the text. Stores created with
+    ``semantic`` also keep the semantic skill hits of each document under
+    "semantic_skills", since they cannot be recomputed later. When the store is full
+    the least recently registered document is evicted. ``version`` changes on
+    every mutation so callers can cache structures derived from the contents.
+    """
+
+    def __init__(self, max_documents: int = MAX_STORED_DOCUMENTS, semantic: bool = False):
+        self.max_documents = max_documents
+        self.semantic = semantic
+        self.version = 0
+        self._profiles: "OrderedDict[str, Dict[str, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, text: str, doc_id: Optional[str] = None) -> str:
+        """
+        Extract and register the profile of a document
+
+        Args:
+            text: Document text
+            doc_id: Optional ID; derived from the content when omitted
+
+        Returns:
+            ID under which the profile is stored
+        """
+        doc_id = doc_id or content_id(text)
+        profile = extract_skills(text)
+        if self.semantic and semantic_matching_enabled():
+            profile["semantic_skills"] = find_semantic_skills([text])[0]
+
+        with self._lock:
+            self._profiles[doc_id] = profile
+            self._profiles.move_to_end(doc_id)
+            while len(self._profiles) > self.max_documents:
+                self._profiles.popitem(last=False)
+            self.version += 1
+        return doc_id
+
+    def get(self, doc_id: str) -> Optional[Dict[str, List[str]]]:
+        """Return the stored profile for an ID, if any"""
+        return self._profiles.get(doc_id)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document; returns False if it was not registered"""
+        with self._lock:
+            if self._profiles.pop(doc_id, None) is None:
+                return False
+            self.version += 1
+            return True
+
+    def snapshot(self) -> Tuple[int, List[Tuple[str, Dict[str, List[str]]]]]:
+        """Return the current version and a copy of all (ID, profile) pairs"""
+        with self._lock:
+            return self.version, list(self._profiles.items())
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+job_store = DocumentStore()
+resume_store = DocumentStore(semantic=True)
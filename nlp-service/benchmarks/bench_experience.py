@@ -0,0 +1,81 @@
+"""
+Experience Matching Benchmark
+Compare keyword reparsing in calculate_experience_match with the values
+parsed once at extraction, and check both give identical scores
+
+Usage (from nlp-service/):
+    python benchmarks/bench_experience.py [--corpus benchmarks/fixtures/experience_corpus.jsonl] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.extractors.skill_extractor import extract_skills, extract_skills_chunked
+from app.caching.section_cache import SectionCache, extract_skills_by_section
+from app.matchers.matching_engine import calculate_experience_match, score_experience
+
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "experience_corpus.jsonl")
+
+
+def load_corpus(path: str):
+    """Split a fixture corpus into resume and job description texts"""
+    resumes, jobs = [], []
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            if "resume_text" in record:
+                resumes.append(record["resume_text"])
+            else:
+                jobs.append(record["job_description"])
+    return resumes, jobs
+
+
+def pair_scores(resume_profiles, job_profiles, score):
+    return [score(resume, job) for resume in resume_profiles for job in job_profiles]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    resumes, jobs = load_corpus(args.corpus)
+    job_profiles = [extract_skills(text) for text in jobs]
+    pairs = len(resumes) * len(jobs) * args.repeat
+
+    def reparsed(resume, job):
+        return calculate_experience_match(resume['experience_keywords'], job['experience_keywords'])
+
+    # Section-merged and windowed profiles must parse to the same values as
+    # whole-text ones, and every pair must score the same either way
+    variants = {
+        "whole text": [extract_skills(text) for text in resumes],
+        "sections": [extract_skills_by_section(text, SectionCache(shared=None))[0] for text in resumes],
+        "chunked": [extract_skills_chunked(text, chunk_size=64) for text in resumes],
+    }
+    for name, resume_profiles in variants.items():
+        expected = pair_scores(resume_profiles, job_profiles, reparsed)
+        actual = pair_scores(resume_profiles, job_profiles, score_experience)
+        mismatches = sum(a != b for a, b in zip(expected, actual))
+        print(f"{name:10s}: {len(expected)} pairs, {mismatches} score mismatches")
+        if mismatches:
+            sys.exit(1)
+
+    resume_profiles = variants["whole text"]
+    for name, score in (("reparsed", reparsed), ("parsed", score_experience)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            pair_scores(resume_profiles, job_profiles, score)
+        elapsed = time.perf_counter() - started
+        print(f"{name:10s}: {pairs / elapsed:12.0f} pairs/s")
+
+
+if __name__ == "__main__":
+    main()
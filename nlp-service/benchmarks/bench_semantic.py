@@ -0,0 +1,66 @@
+"""
+Semantic Matching Benchmark
+Compare exact skill extraction throughput with and without the semantic stage
+
+Usage (from nlp-service/):
+    python benchmarks/bench_semantic.py [--documents 500] [--batch-size 32]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.extractors.skill_extractor import extract_skills, TECHNICAL_SKILLS, SOFT_SKILLS
+from app.matchers import semantic_matcher
+
+
+FILLER = (
+    "Worked closely with product and design to ship features used by thousands of customers. "
+    "Led a team of engineers through a migration and improved reliability across services. "
+)
+
+
+def make_corpus(count: int, seed: int = 7) -> list:
+    """Build synthetic resume-like documents of roughly 2-3 KB each"""
+    rng = random.Random(seed)
+    technical = sorted(TECHNICAL_SKILLS)
+    soft = sorted(SOFT_SKILLS)
+    return [
+        FILLER * 8 + ", ".join(rng.sample(technical, 12) + rng.sample(soft, 4))
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=semantic_matcher.SEMANTIC_BATCH_SIZE)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents)
+
+    started = time.perf_counter()
+    for text in corpus:
+        extract_skills(text)
+    exact_seconds = time.perf_counter() - started
+    print(f"exact:    {len(corpus) / exact_seconds:8.1f} docs/s")
+
+    if semantic_matcher.load_model() is None:
+        print(f"semantic: unavailable ({semantic_matcher.SPACY_MODEL} is not installed)")
+        return
+
+    started = time.perf_counter()
+    semantic_matcher.find_semantic_skills(corpus, batch_size=args.batch_size)
+    semantic_seconds = time.perf_counter() - started
+    combined = exact_seconds + semantic_seconds
+    print(f"semantic: {len(corpus) / semantic_seconds:8.1f} docs/s (batch size {args.batch_size})")
+    print(f"combined: {len(corpus) / combined:8.1f} docs/s "
+          f"({combined / exact_seconds:.1f}x the exact-only time)")
+
+
+if __name__ == "__main__":
+    main()
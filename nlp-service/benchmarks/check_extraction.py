@@ -0,0 +1,108 @@
+"""
+Extraction Equivalence Check
+Verify that the windowed and per-section scans find exactly what the
+whole-text scan finds
+
+Usage (from nlp-service/):
+    python benchmarks/check_extraction.py [--documents 300] [--seed 27]
+        [--corpus benchmarks/fixtures/experience_corpus.jsonl]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.extractors.skill_extractor import (
+    extract_skills, extract_skills_chunked,
+    TECHNICAL_SKILLS, SOFT_SKILLS, EXPERIENCE_KEYWORDS, EDUCATION_KEYWORDS
+)
+from app.extractors.section_splitter import SECTION_HEADINGS
+from app.caching.section_cache import SectionCache, extract_skills_by_section
+
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "experience_corpus.jsonl")
+
+
+# Separators and characters whose lowercase form is longer than the original
+NOISE = [" ", "  ", "\n", ", ", ". ", "/", "-", "(", ")", "İ", "İzmir ", "ß", "Ω ", "x"]
+
+
+def random_document(rng: random.Random) -> str:
+    """Build a document of taxonomy terms, headings, years and noise in random casing"""
+    vocabulary = sorted(TECHNICAL_SKILLS | SOFT_SKILLS | EXPERIENCE_KEYWORDS | EDUCATION_KEYWORDS)
+    headings = sorted(heading for names in SECTION_HEADINGS.values() for heading in names)
+    parts = []
+    for _ in range(rng.randint(20, 200)):
+        choice = rng.random()
+        if choice < 0.08:
+            heading = rng.choice(headings)
+            parts.append(rng.choice([heading.upper(), heading.title() + ":", "\n" + heading + "\n"]))
+        elif choice < 0.5:
+            term = rng.choice(vocabulary)
+            parts.append(term.upper() if rng.random() < 0.3 else term)
+        elif choice < 0.55:
+            parts.append(f"{rng.randint(0, 30)}{rng.choice(['+', ''])} {rng.choice(['years', 'yrs'])}")
+        else:
+            parts.append(rng.choice(NOISE))
+        parts.append(rng.choice(NOISE))
+    return "".join(parts)
+
+
+def check_chunked_scan(documents, rng: random.Random) -> int:
+    """Count documents whose windowed profile differs from the whole-text one"""
+    mismatches = 0
+    for text in documents:
+        chunk_size = rng.choice([16, 33, 64, 257, 1024])
+        if extract_skills_chunked(text, chunk_size=chunk_size) != extract_skills(text):
+            mismatches += 1
+    return mismatches
+
+
+def check_sections(documents) -> int:
+    """Count documents whose merged section profile differs from the whole-text one"""
+    mismatches = 0
+    for text in documents:
+        merged, _ = extract_skills_by_section(text, SectionCache(shared=None))
+        if merged != extract_skills(text):
+            mismatches += 1
+    return mismatches
+
+
+def load_corpus(path: str):
+    with open(path) as f:
+        return [
+            record.get("resume_text") or record["job_description"]
+            for record in map(json.loads, f)
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=27)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    documents = [random_document(rng) for _ in range(args.documents)]
+
+    failed = False
+    mismatches = check_chunked_scan(documents, rng)
+    print(f"chunked scan: {len(documents)} documents, {mismatches} mismatches")
+    failed |= bool(mismatches)
+
+    for name, corpus in (("random", documents), ("fixture", load_corpus(args.corpus))):
+        mismatches = check_sections(corpus)
+        print(f"sections ({name}): {len(corpus)} documents, {mismatches} mismatches")
+        failed |= bool(mismatches)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for multi-worker deployments
+
+The app is imported and warmed up once in the master, then forked, so the
+skill taxonomy, compiled patterns, taxonomy vectors and the shared cache
+mapping are shared copy-on-write by all workers.
+
+Usage:
+    gunicorn -c gunicorn.conf.py main:app
+"""
+
+import os
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+
+def when_ready(server):
+    from app.preload import warm_up, memory_usage
+
+    warm_up()
+    server.log.info("Preloaded app in master: %s", memory_usage())
+
+
+def pre_fork(server, worker):
+    from app.preload import freeze_heap
+
+    freeze_heap()
+
+
+def post_fork(server, worker):
+    from app.preload import record_baseline
+
+    record_baseline()
@@ -3,18 +3,27 @@ AI Resume Analyzer - NLP Microservice
 FastAPI application for text extraction, skill matching, and recommendations
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 import os
 import tempfile
 
 # Import local modules
 from app.extractors.text_extractor import extract_text_from_pdf, extract_text_from_docx
-from app.extractors.skill_extractor import extract_skills
+from app.extractors.skill_extractor import extract_skills, InputTooLargeError
 from app.matchers.matching_engine import calculate_match_score
+from app.matchers.semantic_matcher import semantic_stats
+from app.matchers.pair_stream import NDJSONStreamingResponse, stream_match_results, stream_stats
 from app.recommendations.ai_recommender import generate_recommendations
+from app.recommendations.gap_analyzer import analyze_skill_gaps, UnknownJobError
+from app.store.document_store import job_store, resume_store
+from app.caching.single_flight import request_flights, content_key, single_flight_stats
+from app.caching.section_cache import section_cache
+from app.preload import memory_stats
+from app.middleware.profiler import PROFILING_ENABLED, profiling_middleware, load_profile_summary, run_in_worker
+from app.middleware.admission import ADMISSION_CONTROL_ENABLED, AdmissionControlMiddleware, admission_stats
 
 app = FastAPI(
     title="Resume Analyzer NLP Service",
@@ -22,6 +31,11 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Shed load per endpoint class; /health and other cheap routes bypass it.
+# Added before CORS so rejections still carry CORS headers.
+if ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -29,8 +43,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-Id", "Retry-After"],
 )
 
+# Opt-in request profiling; not registered at all unless enabled
+if PROFILING_ENABLED:
+    app.middleware("http")(profiling_middleware)
+
 
 class TextInput(BaseModel):
     text: str
@@ -41,11 +60,37 @@ class MatchRequest(BaseModel):
     job_description: str
 
 
+class JobRegistration(BaseModel):
+    job_description: str
+    job_id: Optional[str] = None
+
+
+class ResumeRegistration(BaseModel):
+    resume_text: str
+    resume_id: Optional[str] = None
+
+
+class GapRequest(BaseModel):
+    resume_text: str
+    job_ids: Optional[List[str]] = None
+    job_descriptions: Optional[List[str]] = None
+    top_k: int = Field(10, ge=1)
+
+
 class SkillExtractionResponse(BaseModel):
     technical_skills: List[str]
     soft_skills: List[str]
     experience_keywords: List[str]
     education: List[str]
+    years_of_experience: Optional[int] = None
+    experience_level: Optional[int] = None
+    education_level: Optional[int] = None
+
+
+class SectionReport(BaseModel):
+    name: str
+    hash: str
+    reused: bool
 
 
 class MatchResponse(BaseModel):
@@ -55,6 +100,7 @@ class MatchResponse(BaseModel):
     matched_skills: List[str]
     missing_skills: List[str]
     skill_categories: Dict[str, List[str]]
+    resume_sections: List[SectionReport] = []
 
 
 class RecommendationResponse(BaseModel):
@@ -64,6 +110,22 @@ class RecommendationResponse(BaseModel):
     overall_assessment: str
 
 
+class GapRecommendation(BaseModel):
+    skill: str
+    category: str
+    job_frequency: int
+    coverage: float
+    average_score_gain: float
+    max_score_gain: float
+    priority: int
+
+
+class GapResponse(BaseModel):
+    jobs_analyzed: int
+    average_match_score: float
+    recommendations: List[GapRecommendation]
+
+
 @app.get("/")
 async def root():
     return {"message": "Resume Analyzer NLP Service is running", "status": "healthy"}
@@ -74,6 +136,32 @@ async def health_check():
     return {"status": "healthy", "service": "nlp-service"}
 
 
+@app.get("/stats")
+async def service_stats():
+    """Report runtime counters of optional processing stages"""
+    return {
+        "admission": admission_stats(),
+        "semantic_matching": semantic_stats(),
+        "match_stream": stream_stats(),
+        "single_flight": single_flight_stats(),
+        "section_cache": section_cache.snapshot(),
+        "memory": memory_stats()
+    }
+
+
+@app.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    """Return the summary of a stored request profile"""
+    
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    
+    summary = load_profile_summary(profile_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return summary
+
+
 @app.post("/extract-text")
 async def extract_text(file: UploadFile = File(...)):
     """Extract text from uploaded PDF or DOCX file"""
@@ -98,9 +186,9 @@ async def extract_text(file: UploadFile = File(...)):
         
         # Extract text based on file type
         if file_extension == 'pdf':
-            text = extract_text_from_pdf(temp_path)
+            text = await run_in_worker(extract_text_from_pdf, temp_path)
         else:
-            text = extract_text_from_docx(temp_path)
+            text = await run_in_worker(extract_text_from_docx, temp_path)
         
         # Clean up temp file
         os.unlink(temp_path)
@@ -119,8 +207,12 @@ async def extract_skills_endpoint(input_data: TextInput):
         raise HTTPException(status_code=400, detail="Text cannot be empty")
     
     try:
-        skills = extract_skills(input_data.text)
+        skills = await request_flights.run(
+            content_key("extract-skills", input_data.text), extract_skills, input_data.text
+        )
         return skills
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting skills: {str(e)}")
 
@@ -133,12 +225,28 @@ async def match_resume_to_job(request: MatchRequest):
         raise HTTPException(status_code=400, detail="Both resume and job description are required")
     
     try:
-        result = calculate_match_score(request.resume_text, request.job_description)
+        result = await request_flights.run(
+            content_key("match", request.resume_text, request.job_description),
+            calculate_match_score, request.resume_text, request.job_description
+        )
         return result
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating match: {str(e)}")
 
 
+@app.post("/match/stream")
+async def match_pair_stream(request: Request):
+    """
+    Score a streamed NDJSON body of resume-job pairs
+    
+    Each line holds resume_text or resume_id and job_description or job_id.
+    Results are streamed back as NDJSON in input order, one line per pair.
+    """
+    return NDJSONStreamingResponse(stream_match_results(request.stream()))
+
+
 @app.post("/recommend", response_model=RecommendationResponse)
 async def get_recommendations(request: MatchRequest):
     """Generate AI-powered improvement recommendations"""
@@ -147,12 +255,81 @@ async def get_recommendations(request: MatchRequest):
         raise HTTPException(status_code=400, detail="Both resume and job description are required")
     
     try:
-        recommendations = generate_recommendations(request.resume_text, request.job_description)
+        recommendations = await request_flights.run(
+            content_key("recommend", request.resume_text, request.job_description),
+            generate_recommendations, request.resume_text, request.job_description
+        )
         return recommendations
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
 
 
+@app.post("/jobs")
+async def register_job(request: JobRegistration):
+    """Register a job description in the corpus used by /gaps"""
+    
+    if not request.job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description cannot be empty")
+    
+    try:
+        job_id = await run_in_worker(job_store.add, request.job_description, request.job_id)
+        return {"job_id": job_id, "registered_jobs": len(job_store)}
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error registering job: {str(e)}")
+
+
+@app.delete("/jobs/{job_id}")
+async def remove_job(job_id: str):
+    """Remove a registered job description"""
+    
+    if not job_store.remove(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job_id": job_id, "registered_jobs": len(job_store)}
+
+
+@app.post("/resumes")
+async def register_resume(request: ResumeRegistration):
+    """Register a resume so pair streams can refer to it by ID"""
+    
+    if not request.resume_text.strip():
+        raise HTTPException(status_code=400, detail="Resume text cannot be empty")
+    
+    try:
+        resume_id = await run_in_worker(resume_store.add, request.resume_text, request.resume_id)
+        return {"resume_id": resume_id, "registered_resumes": len(resume_store)}
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error registering resume: {str(e)}")
+
+
+@app.post("/gaps", response_model=GapResponse)
+async def analyze_gaps(request: GapRequest):
+    """Rank missing skills by their value across registered or provided jobs"""
+    
+    if not request.resume_text.strip():
+        raise HTTPException(status_code=400, detail="Resume text is required")
+    
+    try:
+        return await run_in_worker(
+            analyze_skill_gaps,
+            request.resume_text,
+            job_ids=request.job_ids,
+            job_descriptions=request.job_descriptions,
+            top_k=request.top_k
+        )
+    except UnknownJobError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except InputTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analyzing skill gaps: {str(e)}")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)